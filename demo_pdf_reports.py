@@ -5,19 +5,25 @@ Generates all three enterprise reports
 
 import sys
 from pathlib import Path
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
 
 sys.path.append(str(Path(__file__).parent / 'src'))
 
-from reports.pdf_generator import PDFReportGenerator
-
 def main():
     print("=" * 60)
     print("ForecastEngine - PDF Report Generation Demo")
     print("=" * 60)
-    
+
+    # Heavy imports deferred until after the banner so the script shows
+    # progress immediately instead of stalling on pandas/reportlab
+    import numpy as np
+    import pandas as pd
+    from reports.pdf_generator import PDFReportGenerator
+
+    # Seeded PCG64 generator: faster bulk sampling than the legacy global
+    # np.random state and makes demo output reproducible
+    _rng = np.random.default_rng(42)
+
     # Initialize PDF generator
     pdf_gen = PDFReportGenerator(output_dir="reports")
     print("\n✓ PDF Generator initialized")
@@ -25,29 +31,35 @@ def main():
     # Generate sample data
     print("\n📊 Generating sample data...")
     
-    # Historical data
+    # Historical data: build the random walk in-place in one buffer
     hist_dates = pd.date_range(end=datetime.now(), periods=60, freq='D')
-    hist_values = 100 + np.cumsum(np.random.randn(60) * 2)
+    hist_values = _rng.standard_normal(60)
+    hist_values *= 2
+    np.cumsum(hist_values, out=hist_values)
+    hist_values += 100
     data = pd.DataFrame({'date': hist_dates, 'sales': hist_values})
-    
-    # Forecast data
+
+    # Forecast data: same in-place walk, then one broadcast produces the
+    # (30, 3) forecast/lower/upper block without per-column temporaries
     forecast_dates = pd.date_range(start=datetime.now() + timedelta(days=1), periods=30, freq='D')
-    forecast_values = hist_values[-1] + np.cumsum(np.random.randn(30) * 1.5)
-    forecast_data = pd.DataFrame({
-        'date': forecast_dates,
-        'forecast': forecast_values,
-        'lower_bound': forecast_values - 10,
-        'upper_bound': forecast_values + 10
-    })
+    forecast_values = _rng.standard_normal(30)
+    forecast_values *= 1.5
+    np.cumsum(forecast_values, out=forecast_values)
+    forecast_values += hist_values[-1]
+    forecast_block = forecast_values[:, None] + np.array([0.0, -10.0, 10.0])
+    forecast_data = pd.DataFrame(forecast_block, columns=['forecast', 'lower_bound', 'upper_bound'])
+    forecast_data.insert(0, 'date', forecast_dates)
     
-    # Product forecast data
-    products_forecast = pd.DataFrame({
-        'product': ['Product A', 'Product B', 'Product C', 'Product D', 'Product E'],
-        'current_demand': [1200, 1400, 1600, 1800, 2000],
-        'forecast_demand': [1400, 1650, 1680, 1620, 2250],
-        'growth_pct': [16.7, 17.9, 5.0, -10.0, 12.5],
-        'confidence': [0.92, 0.88, 0.85, 0.78, 0.90]
-    })
+    # Product forecast data: structured arrays give each column an
+    # explicit dtype up front instead of object-list inference
+    products_forecast = pd.DataFrame(np.array([
+        ('Product A', 1200, 1400, 16.7, 0.92),
+        ('Product B', 1400, 1650, 17.9, 0.88),
+        ('Product C', 1600, 1680, 5.0, 0.85),
+        ('Product D', 1800, 1620, -10.0, 0.78),
+        ('Product E', 2000, 2250, 12.5, 0.90)
+    ], dtype=[('product', 'U16'), ('current_demand', 'i4'), ('forecast_demand', 'i4'),
+              ('growth_pct', 'f4'), ('confidence', 'f4')]))
     
     # Performance metrics
     metrics = {
@@ -65,20 +77,22 @@ def main():
     })
     
     # Inventory data
-    inventory_data = pd.DataFrame({
-        'product': ['Product A', 'Product B', 'Product C', 'Product D', 'Product E'],
-        'current_stock': [1200, 850, 2100, 450, 1650],
-        'forecast_demand': [1400, 1650, 1680, 1620, 2250],
-        'coverage_days': [25, 15, 38, 8, 22]
-    })
-    
+    inventory_data = pd.DataFrame(np.array([
+        ('Product A', 1200, 1400, 25),
+        ('Product B', 850, 1650, 15),
+        ('Product C', 2100, 1680, 38),
+        ('Product D', 450, 1620, 8),
+        ('Product E', 1650, 2250, 22)
+    ], dtype=[('product', 'U16'), ('current_stock', 'i4'),
+              ('forecast_demand', 'i4'), ('coverage_days', 'i4')]))
+
     # Restock schedule
-    restock_schedule = pd.DataFrame({
-        'product': ['Product D', 'Product B', 'Product E'],
-        'restock_date': ['2024-03-15', '2024-03-20', '2024-03-25'],
-        'quantity': [1200, 800, 600],
-        'priority': ['Critical', 'High', 'Medium']
-    })
+    restock_schedule = pd.DataFrame(np.array([
+        ('Product D', '2024-03-15', 1200, 'Critical'),
+        ('Product B', '2024-03-20', 800, 'High'),
+        ('Product E', '2024-03-25', 600, 'Medium')
+    ], dtype=[('product', 'U16'), ('restock_date', 'U10'),
+              ('quantity', 'i4'), ('priority', 'U8')]))
     
     print("✓ Sample data generated")
     
@@ -6,38 +6,42 @@ Launch the FastAPI server
 
 import sys
 import os
-import subprocess
 from pathlib import Path
 
 def run_api():
     """Run the FastAPI server"""
-    
+
     # Add src directory to Python path
     src_path = Path(__file__).parent / "src"
     api_path = src_path / "api" / "main.py"
-    
+
     if not api_path.exists():
         print(f"❌ API file not found: {api_path}")
         sys.exit(1)
-    
+
     print("🚀 Starting ForecastEngine API Server...")
     print("🌐 API will be available at: http://localhost:8000")
     print("📚 API Documentation: http://localhost:8000/docs")
     print("=" * 60)
-    
+
     try:
         # Change to src directory
+        sys.path.insert(0, str(src_path))
         os.chdir(src_path)
-        
-        # Run FastAPI with uvicorn
-        subprocess.run([
-            sys.executable, "-m", "uvicorn", 
+
+        # Run uvicorn in-process instead of spawning a second interpreter;
+        # "auto" picks the C-accelerated uvloop/httptools when installed
+        # and falls back to asyncio/h11 where they are not (e.g. Windows)
+        import uvicorn
+        uvicorn.run(
             "api.main:app",
-            "--host", "0.0.0.0",
-            "--port", "8000",
-            "--reload"
-        ])
-        
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            loop="auto",
+            http="auto"
+        )
+
     except KeyboardInterrupt:
         print("\n👋 API server stopped by user")
     except Exception as e:
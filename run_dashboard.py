@@ -6,7 +6,6 @@ Launch the Streamlit dashboard
 
 import sys
 import os
-import subprocess
 from pathlib import Path
 
 def run_dashboard():
@@ -25,16 +24,15 @@ def run_dashboard():
     print("=" * 60)
     
     try:
-        # Run Streamlit
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", 
+        # Replace this process with Streamlit instead of keeping an idle
+        # parent interpreter alive for the dashboard's lifetime
+        os.execvp(sys.executable, [
+            sys.executable, "-m", "streamlit", "run",
             str(dashboard_path),
             "--server.port", "8501",
             "--server.address", "localhost"
         ])
-        
-    except KeyboardInterrupt:
-        print("\n👋 Dashboard stopped by user")
+
     except Exception as e:
         print(f"❌ Failed to start dashboard: {e}")
         sys.exit(1)
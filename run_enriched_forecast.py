@@ -7,11 +7,21 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+import copy
+import functools
 import yaml
 import logging
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from forecast_engine import ForecastEngine
 
+# Prefer the libyaml C loader when available: ~3-5x faster parse than
+# the pure-Python SafeLoader, with identical safe-load semantics
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 def setup_logging():
     """Setup logging configuration"""
     logging.basicConfig(
@@ -20,20 +30,38 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_path, mtime):
+    """Parse a YAML config, memoized on path and file mtime"""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
 def load_config(config_path='config/enriched_config.yaml'):
     """Load configuration file"""
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
+        # The mtime in the cache key invalidates the memo when the file
+        # changes; callers get a deep copy so the cached dict stays clean
+        mtime = os.path.getmtime(config_path)
+        config = copy.deepcopy(_parse_config(config_path, mtime))
+    except (FileNotFoundError, OSError):
         print(f"Config file {config_path} not found, using default config")
-        return {
+        config = {
             'target_column': 'value',
             'date_column': 'date',
             'data_path': 'data/sample_data.csv',
             'external_apis': {'enabled': True}
         }
 
+    # Cache external API payloads on disk so repeat demo runs skip the
+    # HTTP round-trips; pass --no-cache to force a fresh fetch
+    api_config = config.setdefault('external_apis', {})
+    api_config.setdefault('cache_dir', '.cache/enrichment')
+    api_config.setdefault('cache_ttl_seconds', 3600)
+    if '--no-cache' in sys.argv:
+        api_config['cache_dir'] = None
+
+    return config
+
 def print_section(title):
     """Print formatted section header"""
     print("\n" + "="*70)
@@ -167,28 +195,49 @@ def main():
         print(f"RMSE: {performance.get('rmse', 0):.2f}")
     
     # Scenario analysis with external signals
-    print_section("Scenario Analysis: News Surge Impact")
-    scenario_config = {
-        'name': 'High News Activity',
-        'type': 'demand_multiplier',
-        'multiplier': 1.15,
-        'reason': 'Increased business news coverage'
-    }
-    
-    scenario_result = engine.run_scenario(scenario_config, horizon=30)
-    
-    baseline = scenario_result.get('baseline_forecast', [])
-    scenario_forecast = scenario_result.get('scenario_forecast', [])
-    
-    if baseline and scenario_forecast:
-        baseline_avg = sum(baseline) / len(baseline)
-        scenario_avg = sum(scenario_forecast) / len(scenario_forecast)
-        impact_pct = ((scenario_avg - baseline_avg) / baseline_avg) * 100
-        
-        print(f"Baseline Average: {baseline_avg:.2f}")
-        print(f"Scenario Average: {scenario_avg:.2f}")
-        print(f"Impact: +{impact_pct:.1f}%")
-        print("\nInterpretation: Increased news activity correlates with higher demand")
+    print_section("Scenario Analysis: External Signal Impacts")
+    scenario_configs = [
+        {
+            'name': 'High News Activity',
+            'type': 'demand_multiplier',
+            'multiplier': 1.15,
+            'reason': 'Increased business news coverage'
+        },
+        {
+            'name': 'Quiet News Cycle',
+            'type': 'demand_multiplier',
+            'multiplier': 0.90,
+            'reason': 'Reduced business news coverage'
+        },
+        {
+            'name': 'Traffic Surge',
+            'type': 'demand_multiplier',
+            'multiplier': 1.25,
+            'reason': 'Marketing-driven web traffic spike'
+        }
+    ]
+
+    # Scenarios are independent of each other, so evaluate the grid
+    # concurrently against the already-fitted engine
+    with ThreadPoolExecutor(max_workers=len(scenario_configs)) as executor:
+        scenario_results = list(executor.map(
+            lambda scenario: engine.run_scenario(scenario, horizon=30),
+            scenario_configs
+        ))
+
+    for scenario_config, scenario_result in zip(scenario_configs, scenario_results):
+        baseline = scenario_result.get('baseline_forecast', [])
+        scenario_forecast = scenario_result.get('scenario_forecast', [])
+
+        if baseline and scenario_forecast:
+            baseline_avg = sum(baseline) / len(baseline)
+            scenario_avg = sum(scenario_forecast) / len(scenario_forecast)
+            impact_pct = ((scenario_avg - baseline_avg) / baseline_avg) * 100
+
+            print(f"\n{scenario_config['name']} ({scenario_config['reason']}):")
+            print(f"  Baseline Average: {baseline_avg:.2f}")
+            print(f"  Scenario Average: {scenario_avg:.2f}")
+            print(f"  Impact: {impact_pct:+.1f}%")
     
     # Summary
     print_section("Summary")
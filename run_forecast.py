@@ -12,14 +12,15 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-# Import and run ForecastEngine
-from forecast_engine import main
-
 if __name__ == "__main__":
     print("Starting ForecastEngine...")
     print("=" * 50)
-    
+
     try:
+        # Import after the banner: pulling in the pipeline loads
+        # pandas/sklearn and dominates time to first output
+        from forecast_engine import main
+
         main()
         print("=" * 50)
         print("ForecastEngine completed successfully!")
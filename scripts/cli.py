@@ -0,0 +1,67 @@
+# scripts/cli.py
+
+"""
+ForecastEngine CLI Dispatcher
+Shared argparse parent and a single entry point for the CLI scripts
+"""
+
+import argparse
+import sys
+
+# Subcommands mapped to the script modules that implement them; imports
+# happen at dispatch time so one mode never pays for another's stack
+COMMANDS = ('backfill', 'retrain', 'pipeline')
+
+def build_parent_parser():
+    """Parser holding the options shared by every CLI script"""
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument('--config', '-c', default='config/simple_config.yaml',
+                       help='Configuration file path')
+    return parent
+
+def _split_commands(argv):
+    """Group argv into (command, args) pairs so modes can be chained"""
+    groups = []
+    for token in argv:
+        if token in COMMANDS:
+            groups.append((token, []))
+        elif groups:
+            groups[-1][1].append(token)
+        else:
+            raise SystemExit(
+                f"Expected one of {', '.join(COMMANDS)}, got: {token}"
+            )
+    return groups
+
+def _run(command, command_args):
+    """Dispatch a single subcommand with its own argv"""
+    if command == 'backfill':
+        from backfill_data import main as command_main
+    elif command == 'retrain':
+        from retrain_models import main as command_main
+    else:
+        from run_pipeline import main as command_main
+
+    sys.argv = [f"{sys.argv[0]} {command}"] + command_args
+    command_main()
+
+def main():
+    """Run one or more pipeline modes in a single Python process
+
+    Chaining modes (e.g. `cli.py backfill ... retrain ...`) amortizes
+    the ForecastEngine import across all of them instead of paying the
+    interpreter and library startup cost once per script.
+    """
+    groups = _split_commands(sys.argv[1:])
+    if not groups:
+        raise SystemExit(
+            f"Usage: {sys.argv[0]} {{{','.join(COMMANDS)}}} [options] ..."
+        )
+
+    argv0 = sys.argv[0]
+    for command, command_args in groups:
+        sys.argv[0] = argv0
+        _run(command, command_args)
+
+if __name__ == "__main__":
+    main()
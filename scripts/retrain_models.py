@@ -7,8 +7,11 @@ CLI script to trigger model retraining based on performance drift
 
 import sys
 import os
+import functools
 from pathlib import Path
 import argparse
+import numpy as np
+import orjson
 import yaml
 import logging
 from datetime import datetime
@@ -16,8 +19,15 @@ from datetime import datetime
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from forecast_engine import ForecastEngine
-from mlops.model_manager import ModelManager
+# forecast_engine and the model manager are imported lazily inside the
+# functions that need them, keeping --help fast
+
+# Use the libyaml C loader when PyYAML was built with it (~10x faster
+# parse than the pure-Python loader, same safe-load semantics)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 def setup_logging():
     """Setup logging"""
@@ -27,27 +37,90 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_path, mtime):
+    """Parse a YAML config, memoized on path and file mtime"""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
 def load_config(config_path):
     """Load configuration"""
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
+        return _parse_config(config_path, os.path.getmtime(config_path))
+    except (FileNotFoundError, OSError):
         return {
             'target_column': 'value',
             'date_column': 'date',
             'data_path': 'data/sample_data.csv'
         }
 
+def _report_triggers(triggers, args):
+    """Log the trigger analysis and decide whether retraining is needed"""
+    logger = logging.getLogger(__name__)
+
+    logger.info("=== RETRAINING TRIGGER ANALYSIS ===")
+    for trigger_name, triggered in triggers.items():
+        status = "TRIGGERED" if triggered else "OK"
+        logger.info(f"{trigger_name}: {status}")
+
+    needs_retraining = any(triggers.values()) or args.force
+
+    if needs_retraining:
+        triggered_reasons = [name for name, triggered in triggers.items() if triggered]
+        if args.force:
+            triggered_reasons.append("forced")
+
+        reason = ", ".join(triggered_reasons)
+        logger.info(f"Retraining REQUIRED: {reason}")
+        return True, reason
+    else:
+        logger.info("Retraining NOT REQUIRED - all triggers OK")
+        return False, "no_triggers"
+
 def check_retraining_triggers(config, args):
     """Check if retraining is needed"""
     logger = logging.getLogger(__name__)
-    
+
     logger.info("Checking retraining triggers...")
-    
+
+    from mlops.model_manager import ModelManager
+
+    # --check-only runs on a schedule, so take a lightweight path that
+    # reads the saved metadata and raw data columns without building a
+    # full engine or unpickling any models
+    if args.check_only:
+        import pandas as pd
+
+        model_manager = ModelManager(config)
+
+        try:
+            metadata = model_manager.load_metadata_only()
+        except Exception as e:
+            logger.warning(f"Could not load existing model metadata: {e}")
+            logger.info("Will perform fresh training...")
+            return True, "no_existing_models"
+
+        current_metrics = metadata.get('performance_metrics', {}).get('ensemble', {})
+        if not current_metrics:
+            logger.warning("No saved ensemble metrics found in metadata")
+            return True, "evaluation_failed"
+
+        logger.info(f"Saved performance: {current_metrics}")
+
+        latest_data = pd.read_csv(
+            config.get('data_path', 'data/sample_data.csv'),
+            usecols=[config.get('date_column', 'date'),
+                     config.get('target_column', 'value')]
+        )
+
+        triggers = model_manager.should_retrain(current_metrics, latest_data)
+        return _report_triggers(triggers, args)
+
+    from forecast_engine import ForecastEngine
+
     # Initialize model manager
     model_manager = ModelManager(config)
-    
+
     # Initialize engine for current performance check
     engine = ForecastEngine(config)
     
@@ -86,33 +159,18 @@ def check_retraining_triggers(config, args):
     
     # Check retraining triggers
     triggers = model_manager.should_retrain(current_metrics, latest_data)
-    
-    logger.info("=== RETRAINING TRIGGER ANALYSIS ===")
-    for trigger_name, triggered in triggers.items():
-        status = "TRIGGERED" if triggered else "OK"
-        logger.info(f"{trigger_name}: {status}")
-    
-    # Determine if retraining is needed
-    needs_retraining = any(triggers.values()) or args.force
-    
-    if needs_retraining:
-        triggered_reasons = [name for name, triggered in triggers.items() if triggered]
-        if args.force:
-            triggered_reasons.append("forced")
-        
-        reason = ", ".join(triggered_reasons)
-        logger.info(f"Retraining REQUIRED: {reason}")
-        return True, reason
-    else:
-        logger.info("Retraining NOT REQUIRED - all triggers OK")
-        return False, "no_triggers"
+
+    return _report_triggers(triggers, args)
 
 def perform_retraining(config, args, reason):
     """Perform model retraining"""
     logger = logging.getLogger(__name__)
     
     logger.info(f"Starting model retraining (reason: {reason})...")
-    
+
+    from forecast_engine import ForecastEngine
+    from mlops.model_manager import ModelManager
+
     # Initialize fresh engine
     engine = ForecastEngine(config)
     
@@ -163,16 +221,18 @@ def perform_retraining(config, args, reason):
         )
         
         logger.info(f"Validation forecast generated for {args.validation_horizon} days")
-        logger.info(f"Mean forecast value: {sum(validation_forecast['forecast']) / len(validation_forecast['forecast']):.2f}")
+        logger.info(f"Mean forecast value: {float(np.mean(np.asarray(validation_forecast['forecast'], dtype=np.float64))):.2f}")
         
         # Save validation results
         if args.output_dir:
             output_path = Path(args.output_dir)
-            output_path.mkdir(exist_ok=True)
+            output_path.mkdir(parents=True, exist_ok=True)
             
-            import json
-            with open(output_path / f"retrain_validation_{new_version}.json", 'w') as f:
-                json.dump(validation_forecast, f, indent=2, default=str)
+            (output_path / f"retrain_validation_{new_version}.json").write_bytes(
+                orjson.dumps(validation_forecast,
+                             option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                             default=str)
+            )
             
             logger.info(f"Validation results saved to {output_path}")
     
@@ -186,38 +246,47 @@ def cleanup_old_models(config, args):
         return
     
     logger.info("Cleaning up old model versions...")
-    
+
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    from mlops.model_manager import ModelManager
     model_manager = ModelManager(config)
     registry_path = model_manager.model_registry_path
-    
-    # Get all version directories
-    version_dirs = [d for d in registry_path.iterdir() 
-                   if d.is_dir() and d.name.startswith('v')]
-    
+
+    # scandir reuses the stat results from the directory listing instead
+    # of re-statting each entry through pathlib
+    version_dirs = [entry for entry in os.scandir(registry_path)
+                    if entry.is_dir() and entry.name.startswith('v')]
+
     if len(version_dirs) <= args.keep_versions:
         logger.info(f"Only {len(version_dirs)} versions found, no cleanup needed")
         return
-    
+
     # Sort by creation time and keep only recent versions
-    version_dirs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+    version_dirs.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
     versions_to_delete = version_dirs[args.keep_versions:]
-    
-    for version_dir in versions_to_delete:
+
+    def _delete(entry):
         try:
-            import shutil
-            shutil.rmtree(version_dir)
-            logger.info(f"Deleted old version: {version_dir.name}")
+            shutil.rmtree(entry.path)
+            logger.info("Deleted old version: %s", entry.name)
         except Exception as e:
-            logger.warning(f"Failed to delete {version_dir.name}: {e}")
-    
+            logger.warning("Failed to delete %s: %s", entry.name, e)
+
+    # Deletion is latency-bound unlink syscalls, so overlap them across
+    # threads (rmtree releases the GIL in the C calls)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_delete, versions_to_delete))
+
     logger.info(f"Cleanup completed: kept {args.keep_versions} versions")
 
 def main():
     """Main CLI function"""
-    parser = argparse.ArgumentParser(description="ForecastEngine Model Retraining")
-    
-    parser.add_argument('--config', '-c', default='config/simple_config.yaml',
-                       help='Configuration file path')
+    from cli import build_parent_parser
+    parser = argparse.ArgumentParser(description="ForecastEngine Model Retraining",
+                                     parents=[build_parent_parser()])
+
     parser.add_argument('--force', '-f', action='store_true',
                        help='Force retraining regardless of triggers')
     parser.add_argument('--check-only', action='store_true',
@@ -0,0 +1,3 @@
+# src/api/__init__.py
+
+"""REST API package for ForecastEngine"""
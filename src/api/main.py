@@ -3,28 +3,103 @@ ForecastEngine REST API
 Provides enterprise-grade API endpoints for forecasting operations
 """
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, Optional
+import orjson
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from functools import lru_cache
+from hashlib import blake2b
+import hmac
 import logging
 import asyncio
 import json
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from ..forecast_engine import ForecastEngine
 from ..mlops.model_manager import ModelManager
 from ..scenarios.scenario_engine import ScenarioEngine
 
+def _orjson_default(obj):
+    """Fallback for types orjson does not serialize natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, pd.Series):
+        return obj.to_numpy()
+    return str(obj)
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson
+
+    orjson handles datetimes, UUIDs and numpy arrays natively in Rust,
+    which is several times faster than the jsonable_encoder +
+    json.dumps path for the dict/list-heavy payloads this API returns.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        )
+
+# Lifespan: components live on app.state so state is scoped to the
+# application instance instead of module globals (which leak across
+# reloads and tests), and mutation is guarded by a shared train lock
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Starting ForecastEngine API...")
+
+    # The blocking handlers run on the AnyIO threadpool; its default of
+    # 40 tokens is low for mixed forecast/status traffic
+    import anyio
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+
+    # One synchronous stdout write per request is pure overhead in
+    # production; liveness probes alone would flood it
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
+    # Load configuration
+    config = {
+        "data_sources": {"type": "database", "connection": "postgresql://..."},
+        "models": {"ensemble_method": "weighted_average"},
+        "uncertainty": {"method": "quantile_regression"},
+        "explainability": {"method": "shap"}
+    }
+
+    # Initialize components
+    app.state.forecast_engine = ForecastEngine(config)
+    app.state.model_manager = ModelManager(config)
+    app.state.scenario_engine = ScenarioEngine(config)
+    # Serializes model mutation (training) against model use (predict);
+    # the engine's fit() rebinds models in place, so readers must not
+    # observe a half-trained state
+    app.state.train_lock = threading.Lock()
+
+    logger.info("ForecastEngine API started successfully")
+    yield
+    _training_executor.shutdown(wait=False, cancel_futures=True)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="ForecastEngine API",
     description="Enterprise AI-Powered Forecasting Platform",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -36,22 +111,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON bodies (explanation-heavy forecasts run to
+# hundreds of KB); small payloads like /health pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Security
 security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
-# Global instances (in production, use dependency injection)
-forecast_engine = None
-model_manager = None
-scenario_engine = None
+# Training runs on its own single-worker executor so a multi-minute fit
+# never occupies a request worker; tasks are tracked by id for polling
+_training_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="training")
+_training_tasks: Dict[str, Future] = {}
 
 # Pydantic models for request/response
+# Request models are strict and frozen: no coercion branches in the
+# compiled validators, no extra fields, and immutable once parsed
 class ForecastRequest(BaseModel):
+    model_config = ConfigDict(strict=True, frozen=True, extra='forbid')
+
     horizon: int = Field(..., ge=1, le=365, description="Forecast horizon in periods")
-    confidence_levels: List[float] = Field(default=[0.1, 0.5, 0.9], description="Confidence levels for prediction intervals")
+    # Declared as List because strict mode parses a JSON array as list,
+    # not tuple; the default stays a shared immutable tuple, which
+    # pydantic neither validates nor copies per instantiation
+    confidence_levels: List[float] = Field(default=(0.1, 0.5, 0.9), description="Confidence levels for prediction intervals")
     include_explanation: bool = Field(default=True, description="Include AI explanations")
     target_column: Optional[str] = Field(default=None, description="Target variable name")
 
+# The *Response models below are documentation-only: handlers return
+# ORJSONResponse directly, so no per-field validation runs on trusted
+# engine output (making model_construct unnecessary on this path)
 class ForecastResponse(BaseModel):
     forecast: List[float]
     prediction_intervals: Dict[str, List[float]]
@@ -62,6 +151,8 @@ class ForecastResponse(BaseModel):
     explanations: Optional[Dict[str, Any]]
 
 class ScenarioRequest(BaseModel):
+    model_config = ConfigDict(strict=True, frozen=True, extra='forbid')
+
     scenario_name: str = Field(..., description="Name of the scenario")
     scenario_config: Dict[str, Any] = Field(..., description="Scenario configuration")
     horizon: int = Field(..., ge=1, le=365, description="Forecast horizon")
@@ -76,10 +167,14 @@ class ScenarioResponse(BaseModel):
     timestamp: str
 
 class TrainingRequest(BaseModel):
+    model_config = ConfigDict(strict=True, frozen=True, extra='forbid')
+
     target_column: str = Field(..., description="Target variable to forecast")
     date_column: str = Field(..., description="Date column name")
     external_features: Optional[List[str]] = Field(default=None, description="External feature columns")
-    train_end_date: Optional[str] = Field(default=None, description="End date for training")
+    # Parsed by pydantic-core's fast ISO path once at validation, so
+    # nothing downstream re-parses a date string
+    train_end_date: Optional[datetime] = Field(default=None, description="End date for training")
     retrain: bool = Field(default=False, description="Force retrain existing models")
 
 class ModelPerformanceResponse(BaseModel):
@@ -88,231 +183,366 @@ class ModelPerformanceResponse(BaseModel):
     last_updated: str
     training_status: str
 
+# Request-scoped timestamp: handlers that stamp their responses share
+# one clock read per request instead of calling datetime.now() inline
+def now_iso() -> str:
+    """Current UTC time as an ISO string, computed once per request"""
+    return datetime.now(timezone.utc).isoformat()
+
+# Component dependencies: handlers receive the per-application
+# instances from app.state instead of reaching for module globals
+def get_engine(request: Request) -> ForecastEngine:
+    return request.app.state.forecast_engine
+
+def get_model_manager(request: Request) -> ModelManager:
+    return request.app.state.model_manager
+
+def get_train_lock(request: Request) -> threading.Lock:
+    return request.app.state.train_lock
+
 # Authentication dependency
+_EXPECTED_TOKEN = b"your-api-token"  # Replace with real validation
+_EXPECTED_TOKEN_HASH = blake2b(_EXPECTED_TOKEN, digest_size=16).digest()
+_AUTH_CACHE_TTL = 60  # seconds before a cached validation expires
+
+@lru_cache(maxsize=4096)
+def _validate_token(token_hash: bytes, ttl_bucket: int) -> bool:
+    """Cached token validation (the auth backend call in production)
+
+    Keyed on a blake2b digest so the cache never holds raw credentials;
+    ttl_bucket rolls entries over every _AUTH_CACHE_TTL seconds.
+    """
+    return hmac.compare_digest(token_hash, _EXPECTED_TOKEN_HASH)
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """
     Validate API token (implement your authentication logic)
     """
-    # In production, validate the token against your auth system
     token = credentials.credentials
-    if not token or token != "your-api-token":  # Replace with real validation
+    if not token:
         raise HTTPException(status_code=401, detail="Invalid authentication token")
-    return {"user_id": "authenticated_user"}
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Initialize ForecastEngine components on startup"""
-    global forecast_engine, model_manager, scenario_engine
-    
-    logger.info("Starting ForecastEngine API...")
-    
-    # Load configuration
-    config = {
-        "data_sources": {"type": "database", "connection": "postgresql://..."},
-        "models": {"ensemble_method": "weighted_average"},
-        "uncertainty": {"method": "quantile_regression"},
-        "explainability": {"method": "shap"}
-    }
-    
-    # Initialize components
-    forecast_engine = ForecastEngine(config)
-    model_manager = ModelManager(config)
-    scenario_engine = ScenarioEngine(config)
-    
-    logger.info("ForecastEngine API started successfully")
+    token_hash = blake2b(token.encode(), digest_size=16).digest()
+    if not _validate_token(token_hash, int(time.time() // _AUTH_CACHE_TTL)):
+        raise HTTPException(status_code=401, detail="Invalid authentication token")
+    return {"user_id": "authenticated_user"}
 
 # Health check endpoint
+# Liveness probes hit /health at high rates and only the timestamp
+# changes, so the payload is a static byte template spliced per request
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'","version":"1.0.0"}'
+
 @app.get("/health")
-async def health_check():
+async def health_check(ts: str = Depends(now_iso)):
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "version": "1.0.0"
-    }
+    return Response(_HEALTH_PREFIX + ts.encode() + _HEALTH_SUFFIX,
+                    media_type="application/json")
+
+# Forecast payloads past this horizon are streamed field by field so
+# the first bytes hit the wire before the whole body is buffered
+_STREAM_HORIZON = 90
+
+def _stream_json_object(payload):
+    """Yield a dict as JSON one field at a time"""
+    sep = b'{'
+    for key, value in payload.items():
+        yield sep + orjson.dumps(key) + b':'
+        yield orjson.dumps(value, default=_orjson_default,
+                           option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+        sep = b','
+    yield b'}'
 
 # Forecast endpoints
-@app.post("/forecast", response_model=ForecastResponse)
-async def generate_forecast(
+# The hot endpoints return ORJSONResponse directly: the engine already
+# produces well-typed dicts, so re-validating them through response_model
+# plus jsonable_encoder per request is pure overhead. The models stay in
+# responses= so the OpenAPI schema is unchanged.
+@app.post("/forecast", responses={200: {"model": ForecastResponse}})
+def generate_forecast(
     request: ForecastRequest,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    engine: ForecastEngine = Depends(get_engine),
+    train_lock: threading.Lock = Depends(get_train_lock)
 ):
     """
     Generate AI-powered forecasts with uncertainty intervals
     """
     try:
-        logger.info(f"Generating forecast for horizon: {request.horizon}")
-        
-        if not forecast_engine or not forecast_engine.is_trained:
-            raise HTTPException(
-                status_code=400, 
-                detail="Model not trained. Please train the model first."
+        logger.info("Generating forecast for horizon: %s", request.horizon)
+
+        # Held across the check and the predict so /train can't swap
+        # models out from under us mid-inference
+        with train_lock:
+            if not engine.is_trained:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Model not trained. Please train the model first."
+                )
+
+            # Generate forecast
+            result = engine.predict(
+                horizon=request.horizon,
+                confidence_levels=request.confidence_levels,
+                include_explanation=request.include_explanation
             )
-        
-        # Generate forecast
-        result = forecast_engine.predict(
-            horizon=request.horizon,
-            confidence_levels=request.confidence_levels,
-            include_explanation=request.include_explanation
-        )
-        
-        return ForecastResponse(**result)
-        
+
+        if request.horizon >= _STREAM_HORIZON:
+            return StreamingResponse(_stream_json_object(result),
+                                     media_type="application/json")
+        return ORJSONResponse(result)
+
+    except Exception as e:
+        logger.error("Forecast generation failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Forecast generation failed: {str(e)}")
+
+@app.post("/forecast/batch", responses={200: {"model": ForecastResponse}})
+def generate_forecast_batch(
+    requests: List[ForecastRequest],
+    user: dict = Depends(get_current_user),
+    engine: ForecastEngine = Depends(get_engine),
+    train_lock: threading.Lock = Depends(get_train_lock)
+):
+    """
+    Generate forecasts for many requests in one inference pass
+
+    Amortizes auth, validation and model access across the batch; the
+    engine runs a single prediction at the longest horizon and slices
+    per-request results out of it.
+    """
+    try:
+        logger.info("Generating batch forecast for %s requests", len(requests))
+
+        with train_lock:
+            if not engine.is_trained:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Model not trained. Please train the model first."
+                )
+
+            results = engine.predict_batch([
+                {
+                    'horizon': r.horizon,
+                    'confidence_levels': list(r.confidence_levels),
+                    'include_explanation': r.include_explanation
+                }
+                for r in requests
+            ])
+
+        return ORJSONResponse(results)
+
     except Exception as e:
-        logger.error(f"Forecast generation failed: {str(e)}")
+        logger.error("Batch forecast generation failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Forecast generation failed: {str(e)}")
 
-@app.post("/scenario", response_model=ScenarioResponse)
-async def run_scenario_analysis(
+@app.post("/scenario", responses={200: {"model": ScenarioResponse}})
+def run_scenario_analysis(
     request: ScenarioRequest,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    ts: str = Depends(now_iso),
+    engine: ForecastEngine = Depends(get_engine),
+    train_lock: threading.Lock = Depends(get_train_lock)
 ):
     """
     Run what-if scenario analysis
     """
     try:
-        logger.info(f"Running scenario analysis: {request.scenario_name}")
-        
-        if not forecast_engine or not forecast_engine.is_trained:
-            raise HTTPException(
-                status_code=400,
-                detail="Model not trained. Please train the model first."
+        logger.info("Running scenario analysis: %s", request.scenario_name)
+
+        with train_lock:
+            if not engine.is_trained:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Model not trained. Please train the model first."
+                )
+
+            # Run scenario
+            result = engine.run_scenario(
+                scenario_config=request.scenario_config,
+                horizon=request.horizon
             )
+
+            # Add baseline comparison if requested
+            if request.baseline_comparison:
+                baseline = engine.predict(horizon=request.horizon)
+                result['baseline_forecast'] = baseline['forecast']
         
-        # Run scenario
-        result = forecast_engine.run_scenario(
-            scenario_config=request.scenario_config,
-            horizon=request.horizon
-        )
-        
-        # Add baseline comparison if requested
-        if request.baseline_comparison:
-            baseline = forecast_engine.predict(horizon=request.horizon)
-            result['baseline_forecast'] = baseline['forecast']
-        
-        return ScenarioResponse(
-            scenario_name=request.scenario_name,
-            scenario_forecast=result['scenario_forecast'],
-            baseline_forecast=result.get('baseline_forecast', []),
-            impact_analysis=result.get('impact_analysis', {}),
-            confidence_intervals=result.get('confidence_intervals', {}),
-            timestamp=datetime.now().isoformat()
-        )
+        return ORJSONResponse({
+            "scenario_name": request.scenario_name,
+            "scenario_forecast": result['scenario_forecast'],
+            "baseline_forecast": result.get('baseline_forecast', []),
+            "impact_analysis": result.get('impact_analysis', {}),
+            "confidence_intervals": result.get('confidence_intervals', {}),
+            "timestamp": ts
+        })
         
     except Exception as e:
-        logger.error(f"Scenario analysis failed: {str(e)}")
+        logger.error("Scenario analysis failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Scenario analysis failed: {str(e)}")
 
 # Model management endpoints
 @app.post("/train")
 async def train_model(
     request: TrainingRequest,
-    background_tasks: BackgroundTasks,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    ts: str = Depends(now_iso),
+    engine: ForecastEngine = Depends(get_engine),
+    train_lock: threading.Lock = Depends(get_train_lock)
 ):
     """
     Train or retrain forecasting models
     """
     try:
         logger.info("Starting model training...")
-        
-        # Add training task to background
-        background_tasks.add_task(
+
+        # Submit to the dedicated training executor and hand back a task
+        # id; unlike BackgroundTasks this never ties up a request worker
+        task_id = uuid.uuid4().hex
+        _training_tasks[task_id] = _training_executor.submit(
             _train_model_background,
+            engine,
+            train_lock,
             request.target_column,
             request.date_column,
             request.external_features,
             request.train_end_date,
             request.retrain
         )
-        
+
         return {
             "message": "Model training started",
             "status": "training",
-            "timestamp": datetime.now().isoformat()
+            "task_id": task_id,
+            "timestamp": ts
         }
         
     except Exception as e:
-        logger.error(f"Training initiation failed: {str(e)}")
+        logger.error("Training initiation failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Training failed: {str(e)}")
 
-@app.get("/model/performance", response_model=ModelPerformanceResponse)
-async def get_model_performance(user: dict = Depends(get_current_user)):
+@app.get("/train/status/{task_id}")
+async def get_training_status(
+    task_id: str,
+    user: dict = Depends(get_current_user),
+    ts: str = Depends(now_iso)
+):
+    """
+    Get the status of a submitted training task
+    """
+    future = _training_tasks.get(task_id)
+    if future is None:
+        raise HTTPException(status_code=404, detail="Unknown training task")
+
+    if not future.done():
+        status = "training"
+    else:
+        # Terminal state: evict the entry so a long-lived process does
+        # not accumulate one finished Future (plus any captured
+        # exception and traceback) per /train call
+        _training_tasks.pop(task_id, None)
+        status = "failed" if future.exception() is not None else "completed"
+
+    return {
+        "task_id": task_id,
+        "status": status,
+        "timestamp": ts
+    }
+
+@app.get("/model/performance", responses={200: {"model": ModelPerformanceResponse}})
+def get_model_performance(user: dict = Depends(get_current_user),
+                          ts: str = Depends(now_iso),
+                          engine: ForecastEngine = Depends(get_engine)):
     """
     Get current model performance metrics
     """
     try:
-        if not forecast_engine:
-            raise HTTPException(status_code=400, detail="ForecastEngine not initialized")
-        
         # Get performance metrics
-        performance = forecast_engine.evaluate_performance()
+        performance = engine.evaluate_performance()
         
-        return ModelPerformanceResponse(
-            model_metrics=performance.get('individual_models', {}),
-            ensemble_performance=performance.get('ensemble', {}),
-            last_updated=datetime.now().isoformat(),
-            training_status="completed" if forecast_engine.is_trained else "not_trained"
-        )
+        return ORJSONResponse({
+            "model_metrics": performance.get('individual_models', {}),
+            "ensemble_performance": performance.get('ensemble', {}),
+            "last_updated": ts,
+            "training_status": "completed" if engine.is_trained else "not_trained"
+        })
         
     except Exception as e:
-        logger.error(f"Performance retrieval failed: {str(e)}")
+        logger.error("Performance retrieval failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Performance retrieval failed: {str(e)}")
 
+# Status and quality are polled by dashboards but their underlying
+# drift/quality numbers move on the minute scale; a short TTL collapses
+# the polling storm into one compute per window
+_STATUS_TTL = 30  # seconds
+_status_cache = {"expires": 0.0, "value": None}
+_status_cache_lock = threading.Lock()
+
 @app.get("/model/status")
-async def get_model_status(user: dict = Depends(get_current_user)):
+def get_model_status(user: dict = Depends(get_current_user),
+                     ts: str = Depends(now_iso),
+                     engine: ForecastEngine = Depends(get_engine),
+                     model_manager: ModelManager = Depends(get_model_manager)):
     """
     Get current model training and operational status
     """
     try:
-        status = {
-            "is_trained": forecast_engine.is_trained if forecast_engine else False,
-            "last_training": model_manager.get_last_training_time() if model_manager else None,
-            "model_version": model_manager.get_current_version() if model_manager else None,
-            "performance_drift": model_manager.check_performance_drift() if model_manager else None,
-            "data_drift": model_manager.check_data_drift() if model_manager else None,
-            "timestamp": datetime.now().isoformat()
-        }
-        
+        with _status_cache_lock:
+            if time.monotonic() >= _status_cache["expires"]:
+                _status_cache["value"] = {
+                    "is_trained": engine.is_trained,
+                    "last_training": model_manager.get_last_training_time(),
+                    "model_version": model_manager.get_current_version(),
+                    "performance_drift": model_manager.check_performance_drift(),
+                    "data_drift": model_manager.check_data_drift(),
+                }
+                _status_cache["expires"] = time.monotonic() + _STATUS_TTL
+            # Only the timestamp is patched on the way out
+            status = dict(_status_cache["value"], timestamp=ts)
+
         return status
         
     except Exception as e:
-        logger.error(f"Status retrieval failed: {str(e)}")
+        logger.error("Status retrieval failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Status retrieval failed: {str(e)}")
 
 # Data endpoints
+_quality_cache = {"expires": 0.0, "value": None}
+_quality_cache_lock = threading.Lock()
+
 @app.get("/data/quality")
-async def get_data_quality(user: dict = Depends(get_current_user)):
+def get_data_quality(user: dict = Depends(get_current_user),
+                     ts: str = Depends(now_iso),
+                     engine: ForecastEngine = Depends(get_engine)):
     """
     Get data quality metrics and issues
     """
     try:
-        if not forecast_engine:
-            raise HTTPException(status_code=400, detail="ForecastEngine not initialized")
-        
-        # Get data quality metrics
-        quality_metrics = forecast_engine.data_connector.get_data_quality_metrics()
-        
-        return {
-            "overall_score": quality_metrics.get('overall_score', 0),
-            "completeness": quality_metrics.get('completeness', 0),
-            "consistency": quality_metrics.get('consistency', 0),
-            "timeliness": quality_metrics.get('timeliness', 0),
-            "issues": quality_metrics.get('issues', []),
-            "recommendations": quality_metrics.get('recommendations', []),
-            "timestamp": datetime.now().isoformat()
-        }
+        with _quality_cache_lock:
+            if time.monotonic() >= _quality_cache["expires"]:
+                quality_metrics = engine.data_connector.get_data_quality_metrics()
+                _quality_cache["value"] = {
+                    "overall_score": quality_metrics.get('overall_score', 0),
+                    "completeness": quality_metrics.get('completeness', 0),
+                    "consistency": quality_metrics.get('consistency', 0),
+                    "timeliness": quality_metrics.get('timeliness', 0),
+                    "issues": quality_metrics.get('issues', []),
+                    "recommendations": quality_metrics.get('recommendations', []),
+                }
+                _quality_cache["expires"] = time.monotonic() + _STATUS_TTL
+            quality = dict(_quality_cache["value"], timestamp=ts)
+
+        return quality
         
     except Exception as e:
-        logger.error(f"Data quality check failed: {str(e)}")
+        logger.error("Data quality check failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Data quality check failed: {str(e)}")
 
 # Explanation endpoints
 @app.get("/explain/forecast/{forecast_id}")
-async def get_forecast_explanation(
+def get_forecast_explanation(
     forecast_id: str,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    ts: str = Depends(now_iso)
 ):
     """
     Get detailed explanation for a specific forecast
@@ -337,51 +567,62 @@ async def get_forecast_explanation(
                 "data_quality": 0.92,
                 "historical_accuracy": 0.88
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
         
         return explanation
         
     except Exception as e:
-        logger.error(f"Explanation retrieval failed: {str(e)}")
+        logger.error("Explanation retrieval failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Explanation retrieval failed: {str(e)}")
 
 # Background task functions
-async def _train_model_background(
+def _train_model_background(
+    engine: ForecastEngine,
+    train_lock: threading.Lock,
     target_column: str,
     date_column: str,
     external_features: Optional[List[str]],
-    train_end_date: Optional[str],
+    train_end_date: Optional[datetime],
     retrain: bool
 ):
-    """Background task for model training"""
+    """Training task body, run on the dedicated training executor"""
     try:
-        global forecast_engine
-        
-        if retrain or not forecast_engine.is_trained:
-            forecast_engine.fit(
-                target_column=target_column,
-                date_column=date_column,
-                external_features=external_features,
-                train_end_date=train_end_date
-            )
-            logger.info("Model training completed successfully")
-        else:
-            logger.info("Model already trained, skipping training")
-            
+        with train_lock:
+            if retrain or not engine.is_trained:
+                engine.fit(
+                    target_column=target_column,
+                    date_column=date_column,
+                    external_features=external_features,
+                    train_end_date=train_end_date
+                )
+                logger.info("Model training completed successfully")
+            else:
+                logger.info("Model already trained, skipping training")
+
     except Exception as e:
-        logger.error(f"Background training failed: {str(e)}")
+        logger.error("Background training failed: %s", e)
+        raise
 
 # Error handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Custom HTTP exception handler"""
-    return {
-        "error": exc.detail,
-        "status_code": exc.status_code,
-        "timestamp": datetime.now().isoformat()
-    }
+    # Must be a real Response: returning a bare dict re-encoded it with
+    # status 200 and dropped exc.status_code on the floor
+    return ORJSONResponse(
+        {
+            "error": exc.detail,
+            "status_code": exc.status_code,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        },
+        status_code=exc.status_code
+    )
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # "auto" selects uvloop/httptools when available and falls back to
+    # asyncio/h11 where they are not (uvloop is skipped on Windows); the
+    # synchronous per-request access log write is disabled
+    uvicorn.run(app, host="0.0.0.0", port=8000,
+                loop="auto", http="auto", access_log=False)
\ No newline at end of file
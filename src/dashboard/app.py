@@ -8,19 +8,16 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import requests
 import json
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
 
-# Add src to path for imports
+# Add src to path for imports; heavier modules such as requests are
+# imported lazily inside the functions that use them so dashboard
+# startup only pays for what the first page needs
 sys.path.append(str(Path(__file__).parent.parent))
 
-from forecast_engine import ForecastEngine
-
 # Page configuration
 st.set_page_config(
     page_title="ForecastEngine Dashboard",
@@ -29,8 +26,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS, built once at import instead of re-parsed inline per rerun
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -45,7 +42,100 @@ st.markdown("""
         margin: 0.5rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER_HTML = '<h1 class="main-header">🚀 ForecastEngine Dashboard</h1>'
+
+# Static bar-chart values as ready-made ndarrays; they double as the
+# marker colors, so plotly serializes them without converting the same
+# Python list twice per render
+_MODEL_MAE_SCORES = np.array([15.2, 12.8, 18.5, 11.3])
+_FEATURE_IMPORTANCE = np.array([0.35, 0.28, 0.18, 0.12, 0.07])
+_SCENARIO_IMPACTS = np.array([0.0, -8.5, 15.2, -12.8])
+
+# z-scores by confidence level; encodes the same alpha thresholds the
+# old per-level if/else chain did
+_Z_SCORES = {0.95: 1.96, 0.9: 1.645}
+_Z_DEFAULT = 1.282
+
+# Re-emitted on every run: Streamlit removes elements that a rerun does
+# not re-render, so gating this would drop the styles after the first
+# interaction. The win is the constant itself — built once at import
+# instead of re-parsed inline per rerun.
+st.markdown(_CSS, unsafe_allow_html=True)
+
+@st.cache_resource
+def _http_session():
+    """Shared keep-alive session, reused across reruns and sessions
+
+    Skips the per-click DNS/TCP handshake a bare requests.post pays.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # The API lives on localhost, so skip the per-request environment
+    # scan for proxy settings and .netrc credentials
+    session.trust_env = False
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_data(ttl=60)
+def _fetch_forecast(api_base_url, horizon, confidence_levels, include_explanation):
+    """Fetch a forecast from the API, cached for 60s per parameter set
+
+    confidence_levels must be a tuple so the arguments hash. Failures
+    propagate as requests exceptions, which st.cache_data does not
+    cache, so a transient outage never pins the local fallback for the
+    rest of the TTL; the caller catches them and falls back.
+    """
+    # Short connect timeout so the local fallback kicks in quickly
+    # when the API is down
+    response = _http_session().post(
+        f"{api_base_url}/forecast",
+        json={
+            "horizon": horizon,
+            "confidence_levels": list(confidence_levels),
+            "include_explanation": include_explanation
+        },
+        timeout=(1.0, 5.0)
+    )
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data
+def _future_dates(start_date, periods):
+    """Forecast axis dates, cached per (day, horizon) pair
+
+    Takes a date rather than a datetime so the cache key stays stable
+    across reruns within the same day. Returns the underlying
+    datetime64 array; plotly does not need the DatetimeIndex wrapper.
+    """
+    return pd.date_range(start=start_date, periods=periods, freq='D').values
+
+@st.cache_data(ttl=300)
+def _build_sample_forecast_data():
+    """Build the sample historical/forecast series once per cache window
+
+    A seeded generator keeps the cached arrays stable across reruns, so
+    the chart does not jump every time an unrelated widget changes.
+    """
+    rng = np.random.default_rng(42)
+    dates = pd.date_range(start='2024-01-01', end='2024-03-31', freq='D')
+    historical = 100 + np.cumsum(rng.normal(0.1, 2, len(dates)))
+    future_dates = pd.date_range(start='2024-04-01', periods=30, freq='D')
+    forecast = historical[-1] + np.cumsum(rng.normal(0.05, 1.5, 30))
+    return dates, historical, future_dates, forecast
+
+@st.cache_data(ttl=300)
+def _build_performance_trend_data():
+    """Build the sample MAE trend series once per cache window"""
+    rng = np.random.default_rng(42)
+    dates = pd.date_range(start='2024-01-01', periods=30, freq='D')
+    mae_trend = 15 + rng.normal(0, 1, 30)
+    return dates, mae_trend
 
 class ForecastDashboard:
     """Main dashboard class"""
@@ -53,10 +143,11 @@ class ForecastDashboard:
     def __init__(self):
         self.api_base_url = "http://localhost:8000"  # API endpoint
         self.forecast_engine = None
+        self.http = _http_session()
         
     def run(self):
         """Main dashboard application"""
-        st.markdown('<h1 class="main-header">🚀 ForecastEngine Dashboard</h1>', unsafe_allow_html=True)
+        st.markdown(_HEADER_HTML, unsafe_allow_html=True)
         
         # Sidebar navigation
         page = st.sidebar.selectbox(
@@ -77,6 +168,19 @@ class ForecastDashboard:
         """Main forecasting page"""
         st.header("📊 Forecast Overview")
         
+        self.forecast_controls()
+        
+        # Sample data visualization
+        st.subheader("📈 Historical Data & Forecast")
+        self.display_sample_forecast()
+    
+    @st.fragment
+    def forecast_controls(self):
+        """Forecast parameters and generation
+
+        A fragment, so tweaking the sliders or generating a forecast
+        reruns only this section rather than the whole page.
+        """
         # Forecast parameters
         col1, col2, col3 = st.columns(3)
         
@@ -100,10 +204,6 @@ class ForecastDashboard:
                 
                 if forecast_result:
                     self.display_forecast_results(forecast_result)
-        
-        # Sample data visualization
-        st.subheader("📈 Historical Data & Forecast")
-        self.display_sample_forecast()
     
     def model_performance_page(self):
         """Model performance monitoring page"""
@@ -140,6 +240,15 @@ class ForecastDashboard:
         """Scenario analysis page"""
         st.header("📈 Scenario Analysis")
         
+        self.scenario_controls()
+        
+        # Sample scenario comparison
+        st.subheader("📊 Scenario Comparison")
+        self.display_sample_scenarios()
+    
+    @st.fragment
+    def scenario_controls(self):
+        """Scenario configuration and execution, rerun in isolation"""
         # Scenario configuration
         st.subheader("🎛️ Configure Scenario")
         
@@ -184,10 +293,6 @@ class ForecastDashboard:
                 
                 if scenario_result:
                     self.display_scenario_results(scenario_result)
-        
-        # Sample scenario comparison
-        st.subheader("📊 Scenario Comparison")
-        self.display_sample_scenarios()
     
     def settings_page(self):
         """Settings and configuration page"""
@@ -219,8 +324,8 @@ class ForecastDashboard:
         if uploaded_file is not None:
             st.success("Data uploaded successfully!")
             
-            # Show data preview
-            df = pd.read_csv(uploaded_file)
+            # Show data preview; only parse the rows the preview needs
+            df = pd.read_csv(uploaded_file, nrows=20)
             st.dataframe(df.head())
         
         # Save settings
@@ -229,50 +334,60 @@ class ForecastDashboard:
     
     def generate_forecast(self, horizon, confidence_levels, include_explanation):
         """Generate forecast using API or local engine"""
+        import requests
+
+        # Try API first, via the cached fetcher so repeated clicks with
+        # the same parameters reuse the previous response
         try:
-            # Try API first
-            response = requests.post(
-                f"{self.api_base_url}/forecast",
-                json={
-                    "horizon": horizon,
-                    "confidence_levels": confidence_levels,
-                    "include_explanation": include_explanation
-                },
-                timeout=30
+            return _fetch_forecast(
+                self.api_base_url, horizon, tuple(confidence_levels), include_explanation
             )
-            
-            if response.status_code == 200:
-                return response.json()
-        except:
+        except (requests.ConnectionError, requests.Timeout):
+            # API down or slow: silently fall back to the local engine
             pass
-        
+        except requests.JSONDecodeError:
+            # A 200 with a broken body is worth surfacing, unlike an
+            # unreachable API
+            st.error("Forecast API returned an unreadable response; using local forecast.")
+        except requests.RequestException:
+            # Error status from the API: fall back as well
+            pass
+
         # Fallback to local engine
         return self.generate_local_forecast(horizon, confidence_levels, include_explanation)
     
     def generate_local_forecast(self, horizon, confidence_levels, include_explanation):
         """Generate forecast using local engine"""
-        # Create sample forecast data
+        # Create sample forecast data; one vectorized draw instead of a
+        # Python loop with a normal() call per step
         base_value = 100
         trend = 0.02
         noise = 0.1
         
-        forecast = []
-        for i in range(horizon):
-            value = base_value * (1 + trend * i) + np.random.normal(0, noise * base_value)
-            forecast.append(max(0, value))
+        # Seeded like the sample-data builders, so repeated clicks with
+        # the same parameters produce the same fallback forecast
+        rng = np.random.default_rng(42)
+        steps = np.arange(horizon)
+        forecast_values = np.maximum(
+            0, base_value * (1 + trend * steps) + rng.normal(0, noise * base_value, horizon)
+        )
+        
+        # Create prediction intervals: one (horizon, levels) broadcast
+        # builds every width at once, and the per-level dict entries are
+        # column views of the bound matrices. Plotly consumes the
+        # ndarrays directly, so nothing expands to Python lists.
+        z_scores = np.array([_Z_SCORES.get(level, _Z_DEFAULT) for level in confidence_levels])
+        interval_widths = (forecast_values * 0.1)[:, None] * z_scores[None, :]
+        lower_bounds = forecast_values[:, None] - interval_widths
+        upper_bounds = forecast_values[:, None] + interval_widths
         
-        # Create prediction intervals
         prediction_intervals = {}
-        for level in confidence_levels:
-            alpha = 1 - level
-            z_score = 1.96 if alpha <= 0.05 else 1.645 if alpha <= 0.1 else 1.282
-            
-            interval_width = np.array(forecast) * 0.1 * z_score
-            prediction_intervals[f'lower_{level}'] = (np.array(forecast) - interval_width).tolist()
-            prediction_intervals[f'upper_{level}'] = (np.array(forecast) + interval_width).tolist()
+        for i, level in enumerate(confidence_levels):
+            prediction_intervals[f'lower_{level}'] = lower_bounds[:, i]
+            prediction_intervals[f'upper_{level}'] = upper_bounds[:, i]
         
         return {
-            'forecast': forecast,
+            'forecast': forecast_values,
             'prediction_intervals': prediction_intervals,
             'confidence_levels': confidence_levels,
             'explanations': {
@@ -292,14 +407,16 @@ class ForecastDashboard:
     def run_scenario_analysis(self, scenario_config):
         """Run scenario analysis"""
         # Create sample scenario results
-        baseline = [100 + i * 0.5 for i in range(30)]
+        baseline = 100 + np.arange(30) * 0.5
         
         if scenario_config['type'] == 'price_change':
             multiplier = 1 + scenario_config['price_change'] * scenario_config['price_elasticity']
-            scenario_forecast = [x * multiplier for x in baseline]
         else:
             multiplier = scenario_config.get('demand_multiplier', 1.1)
-            scenario_forecast = [x * multiplier for x in baseline]
+        scenario_forecast = baseline * multiplier
+        
+        baseline_total = baseline.sum()
+        scenario_total = scenario_forecast.sum()
         
         return {
             'scenario_name': scenario_config['name'],
@@ -307,7 +424,7 @@ class ForecastDashboard:
             'baseline_forecast': baseline,
             'impact_analysis': {
                 'total_impact': {
-                    'percentage': ((sum(scenario_forecast) - sum(baseline)) / sum(baseline)) * 100
+                    'percentage': ((scenario_total - baseline_total) / baseline_total) * 100
                 }
             }
         }
@@ -316,19 +433,17 @@ class ForecastDashboard:
         """Display forecast results"""
         st.subheader("🔮 Forecast Results")
         
-        # Create forecast chart
-        fig = go.Figure()
+        # Build all traces up front so the figure is validated once;
+        # add_trace revalidates the whole figure on every call
+        dates = _future_dates(datetime.now().date(), len(forecast_result['forecast']))
         
-        # Add forecast line
-        dates = pd.date_range(start=datetime.now(), periods=len(forecast_result['forecast']), freq='D')
-        
-        fig.add_trace(go.Scatter(
+        traces = [go.Scattergl(
             x=dates,
             y=forecast_result['forecast'],
             mode='lines+markers',
             name='Forecast',
             line=dict(color='blue', width=3)
-        ))
+        )]
         
         # Add confidence intervals
         if 'prediction_intervals' in forecast_result:
@@ -337,7 +452,7 @@ class ForecastDashboard:
                 upper_key = f'upper_{level}'
                 
                 if lower_key in forecast_result['prediction_intervals']:
-                    fig.add_trace(go.Scatter(
+                    traces.append(go.Scattergl(
                         x=dates,
                         y=forecast_result['prediction_intervals'][upper_key],
                         fill=None,
@@ -346,7 +461,7 @@ class ForecastDashboard:
                         showlegend=False
                     ))
                     
-                    fig.add_trace(go.Scatter(
+                    traces.append(go.Scattergl(
                         x=dates,
                         y=forecast_result['prediction_intervals'][lower_key],
                         fill='tonexty',
@@ -356,14 +471,14 @@ class ForecastDashboard:
                         fillcolor=f'rgba(0,100,80,{0.2 + level*0.1})'
                     ))
         
-        fig.update_layout(
+        fig = go.Figure(data=traces, layout=go.Layout(
             title="Forecast with Confidence Intervals",
             xaxis_title="Date",
             yaxis_title="Value",
             hovermode='x unified'
-        )
+        ))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='forecast_results_chart')
         
         # Display explanations if available
         if forecast_result.get('explanations'):
@@ -384,97 +499,77 @@ class ForecastDashboard:
     
     def display_sample_forecast(self):
         """Display sample forecast visualization"""
-        # Generate sample data
-        dates = pd.date_range(start='2024-01-01', end='2024-03-31', freq='D')
-        historical = 100 + np.cumsum(np.random.normal(0.1, 2, len(dates)))
-        
-        # Future dates
-        future_dates = pd.date_range(start='2024-04-01', periods=30, freq='D')
-        forecast = historical[-1] + np.cumsum(np.random.normal(0.05, 1.5, 30))
-        
-        fig = go.Figure()
-        
-        # Historical data
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=historical,
-            mode='lines',
-            name='Historical',
-            line=dict(color='gray', width=2)
-        ))
-        
-        # Forecast
-        fig.add_trace(go.Scatter(
-            x=future_dates,
-            y=forecast,
-            mode='lines+markers',
-            name='Forecast',
-            line=dict(color='blue', width=3)
-        ))
+        dates, historical, future_dates, forecast = _build_sample_forecast_data()
+        
+        traces = [
+            go.Scattergl(
+                x=dates,
+                y=historical,
+                mode='lines',
+                name='Historical',
+                line=dict(color='gray', width=2)
+            ),
+            go.Scattergl(
+                x=future_dates,
+                y=forecast,
+                mode='lines+markers',
+                name='Forecast',
+                line=dict(color='blue', width=3)
+            )
+        ]
         
-        fig.update_layout(
+        fig = go.Figure(data=traces, layout=go.Layout(
             title="Sample Forecast Visualization",
             xaxis_title="Date",
             yaxis_title="Value",
             hovermode='x unified'
-        )
+        ))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='sample_forecast_chart')
     
     def display_model_comparison(self):
         """Display model comparison chart"""
         models = ['ARIMA', 'Random Forest', 'Linear', 'Ensemble']
-        mae_scores = [15.2, 12.8, 18.5, 11.3]
         
-        fig = px.bar(
+        fig = go.Figure(data=[go.Bar(
             x=models,
-            y=mae_scores,
-            title="Model Performance Comparison (MAE)",
-            color=mae_scores,
-            color_continuous_scale='RdYlBu_r'
-        )
+            y=_MODEL_MAE_SCORES,
+            marker=dict(color=_MODEL_MAE_SCORES, colorscale='RdYlBu_r')
+        )], layout=go.Layout(title="Model Performance Comparison (MAE)"))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='model_comparison_chart')
     
     def display_feature_importance(self):
         """Display feature importance chart"""
         features = ['lag_1', 'lag_7', 'rolling_mean_7', 'seasonality', 'trend']
-        importance = [0.35, 0.28, 0.18, 0.12, 0.07]
         
-        fig = px.bar(
-            x=importance,
+        fig = go.Figure(data=[go.Bar(
+            x=_FEATURE_IMPORTANCE,
             y=features,
             orientation='h',
-            title="Feature Importance",
-            color=importance,
-            color_continuous_scale='viridis'
-        )
+            marker=dict(color=_FEATURE_IMPORTANCE, colorscale='viridis')
+        )], layout=go.Layout(title="Feature Importance"))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='feature_importance_chart')
     
     def display_performance_trends(self):
         """Display performance trends over time"""
-        dates = pd.date_range(start='2024-01-01', periods=30, freq='D')
-        mae_trend = 15 + np.random.normal(0, 1, 30)
-        
-        fig = go.Figure()
+        dates, mae_trend = _build_performance_trend_data()
         
-        fig.add_trace(go.Scatter(
+        fig = go.Figure(data=[go.Scattergl(
             x=dates,
             y=mae_trend,
             mode='lines+markers',
             name='MAE',
             line=dict(color='red', width=2)
-        ))
-        
-        fig.update_layout(
+        )], layout=go.Layout(
             title="Model Performance Over Time",
             xaxis_title="Date",
             yaxis_title="MAE",
             hovermode='x unified'
-        )
+        ))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='performance_trends_chart')
     
     def display_scenario_results(self, scenario_result):
         """Display scenario analysis results"""
@@ -497,53 +592,55 @@ class ForecastDashboard:
             st.metric("Risk Level", risk_level)
         
         # Scenario comparison chart
-        dates = pd.date_range(start=datetime.now(), periods=len(scenario_result['baseline_forecast']), freq='D')
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=scenario_result['baseline_forecast'],
-            mode='lines',
-            name='Baseline',
-            line=dict(color='gray', width=2)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=scenario_result['scenario_forecast'],
-            mode='lines',
-            name='Scenario',
-            line=dict(color='red', width=3)
-        ))
+        dates = _future_dates(datetime.now().date(), len(scenario_result['baseline_forecast']))
+        
+        traces = [
+            go.Scattergl(
+                x=dates,
+                y=scenario_result['baseline_forecast'],
+                mode='lines',
+                name='Baseline',
+                line=dict(color='gray', width=2)
+            ),
+            go.Scattergl(
+                x=dates,
+                y=scenario_result['scenario_forecast'],
+                mode='lines',
+                name='Scenario',
+                line=dict(color='red', width=3)
+            )
+        ]
         
-        fig.update_layout(
+        fig = go.Figure(data=traces, layout=go.Layout(
             title="Scenario vs Baseline Comparison",
             xaxis_title="Date",
             yaxis_title="Value",
             hovermode='x unified'
-        )
+        ))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='scenario_results_chart')
     
     def display_sample_scenarios(self):
         """Display sample scenario comparison"""
         scenarios = ['Baseline', 'Price +10%', 'Marketing Campaign', 'Economic Downturn']
-        impacts = [0, -8.5, 15.2, -12.8]
         
-        fig = px.bar(
+        fig = go.Figure(data=[go.Bar(
             x=scenarios,
-            y=impacts,
+            y=_SCENARIO_IMPACTS,
+            marker=dict(color=_SCENARIO_IMPACTS, colorscale='RdYlBu')
+        )], layout=go.Layout(
             title="Scenario Impact Comparison",
-            color=impacts,
-            color_continuous_scale='RdYlBu'
-        )
-        
-        fig.update_layout(yaxis_title="Impact (%)")
+            yaxis_title="Impact (%)"
+        ))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='sample_scenarios_chart')
+
+@st.cache_resource
+def _get_dashboard():
+    """One ForecastDashboard instance per server process"""
+    return ForecastDashboard()
 
 # Run the dashboard
 if __name__ == "__main__":
-    dashboard = ForecastDashboard()
+    dashboard = _get_dashboard()
     dashboard.run()
\ No newline at end of file
@@ -8,6 +8,8 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
+import hashlib
+import io
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -27,227 +29,109 @@ st.set_page_config(
 )
 
 # COMPREHENSIVE CSS FIX FOR TEXT VISIBILITY
-st.markdown("""
+@st.cache_resource
+def _css_block() -> str:
+    """Dashboard stylesheet, built once per server process instead of
+    re-evaluated on every rerun
+
+    Scoped class and testid selectors only: text color comes from
+    inheritance off .main and the card containers rather than `.main *`
+    style universal descendants, which force a full style recalculation
+    every time Streamlit swaps DOM in.
+    """
+    return """
 <style>
-    /* DARK THEME BACKGROUND WITH WHITE TEXT */
-    .main {
-        background-color: #1f2937;
-    }
-    
-    /* ALL TEXT WHITE ON DARK BACKGROUND */
-    .main, .main *, .block-container, .block-container *, 
-    .element-container, .element-container *, 
-    h1, h2, h3, h4, h5, h6, p, span, div, label {
-        color: #FFFFFF !important;
-    }
-    
-    /* STREAMLIT COMPONENT LABELS - WHITE */
-    [data-testid="stMarkdown"], [data-testid="stMarkdown"] * {
-        color: #FFFFFF !important;
-    }
-    
-    [data-testid="stText"], [data-testid="stText"] * {
-        color: #FFFFFF !important;
-    }
-    
-    /* SLIDER LABELS */
-    [data-testid="stSlider"] label, [data-testid="stSlider"] span {
-        color: #E5E7EB !important;
-    }
-    
-    /* CHECKBOX LABELS */
-    [data-testid="stCheckbox"] label, [data-testid="stCheckbox"] span {
-        color: #E5E7EB !important;
-    }
-    
-    /* SELECTBOX LABELS */
-    [data-testid="stSelectbox"] label, [data-testid="stSelectbox"] span {
-        color: #E5E7EB !important;
-    }
-    
-    /* TEXT INPUT LABELS */
-    [data-testid="stTextInput"] label {
-        color: #E5E7EB !important;
-    }
-    
-    /* DATE INPUT LABELS */
-    [data-testid="stDateInput"] label {
-        color: #E5E7EB !important;
-    }
-    
-    /* RADIO LABELS */
-    [data-testid="stRadio"] label, [data-testid="stRadio"] span {
-        color: #FFFFFF !important;
-    }
-    
-    /* METRIC LABELS - LIGHT GRAY */
-    [data-testid="stMetricLabel"] {
-        color: #E5E7EB !important;
-    }
-    
-    /* METRIC VALUES - WHITE */
-    [data-testid="stMetricValue"] {
-        color: #FFFFFF !important;
-        font-weight: 800 !important;
-    }
-    
-    /* SIDEBAR - WHITE TEXT */
-    [data-testid="stSidebar"], [data-testid="stSidebar"] * {
-        color: #FFFFFF !important;
-    }
-    
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1e3a8a 0%, #1e40af 100%);
-    }
-    
-    /* WHITE CARDS WITH DARK TEXT */
-    .kpi-card {
-        background: #FFFFFF !important;
-        padding: 28px;
-        border-radius: 16px;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.3);
-        border-left: 6px solid #3b82f6;
-        margin-bottom: 1.5rem;
-    }
-    
-    .kpi-card, .kpi-card * {
-        color: #111827 !important;
-    }
-    
-    .kpi-value {
-        font-size: 40px;
-        font-weight: 900;
-        color: #000000 !important;
-        margin: 14px 0;
-    }
-    
-    .kpi-label {
-        font-size: 13px;
-        color: #374151 !important;
-        text-transform: uppercase;
-        letter-spacing: 1.2px;
-        font-weight: 700;
-    }
-    
-    .kpi-trend {
-        font-size: 18px;
-        font-weight: 800;
-        margin-top: 14px;
-    }
-    
-    .trend-up {
-        color: #10b981 !important;
-    }
-    
-    .trend-down {
-        color: #ef4444 !important;
-    }
-    
-    /* INSIGHT CARDS - WHITE WITH DARK TEXT */
-    .insight-card {
-        background: #FFFFFF !important;
-        padding: 22px;
-        border-radius: 14px;
-        box-shadow: 0 3px 15px rgba(0,0,0,0.3);
-        margin-bottom: 18px;
-        border-left: 6px solid;
-    }
-    
-    .insight-card, .insight-card * {
-        color: #111827 !important;
-    }
-    
-    .insight-card strong {
-        color: #111827 !important;
-        font-size: 16px;
-        font-weight: 800;
-    }
-    
-    .insight-card small {
-        color: #374151 !important;
-        font-size: 14px;
-    }
-    
-    .insight-info { border-left-color: #3b82f6; }
-    .insight-success { border-left-color: #10b981; }
-    .insight-warning { border-left-color: #f59e0b; }
-    
-    /* WHITE CONTAINERS WITH DARK TEXT */
-    .white-box {
-        background: #FFFFFF !important;
-        padding: 32px;
-        border-radius: 16px;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.3);
-        margin-bottom: 2.5rem;
-    }
-    
-    .white-box, .white-box * {
-        color: #111827 !important;
-    }
-    
-    /* SECTION TITLES - WHITE */
-    .section-title {
-        font-size: 24px;
-        font-weight: 900;
-        color: #FFFFFF !important;
-        margin: 2.5rem 0 1.5rem 0;
-        padding-left: 16px;
-        border-left: 6px solid #3b82f6;
-    }
-    
-    /* HEADER TITLE IN WHITE BOX - DARK TEXT */
-    .white-box .header-title {
-        color: #111827 !important;
-    }
-    
-    /* BUTTONS - WHITE TEXT */
-    .stButton>button {
-        background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
-        color: #FFFFFF !important;
-        border: none;
-        border-radius: 14px;
-        padding: 16px 32px;
-        font-weight: 800;
-        font-size: 16px;
-        box-shadow: 0 6px 24px rgba(59, 130, 246, 0.45);
-    }
-    
-    /* RISK BADGES */
-    .risk-low {
-        background-color: #d1fae5;
-        color: #065f46 !important;
-        padding: 8px 16px;
-        border-radius: 20px;
-        font-weight: 800;
-    }
-    
-    .risk-medium {
-        background-color: #fef3c7;
-        color: #92400e !important;
-        padding: 8px 16px;
-        border-radius: 20px;
-        font-weight: 800;
-    }
-    
-    .risk-high {
-        background-color: #fee2e2;
-        color: #991b1b !important;
-        padding: 8px 16px;
-        border-radius: 20px;
-        font-weight: 800;
-    }
-    
-    /* PREVENT TRANSPARENT TEXT */
-    * {
-        opacity: 1 !important;
-    }
-    
-    .main .block-container {
-        padding-top: 1.5rem;
-        max-width: 100%;
-    }
+.main{background-color:#1f2937;color:#FFFFFF}
+.main .block-container{padding-top:1.5rem;max-width:100%;color:#FFFFFF}
+h1,h2,h3,h4,h5,h6,p,span,div,label{color:inherit}
+[data-testid="stMarkdown"],[data-testid="stText"]{color:#FFFFFF !important}
+[data-testid="stSlider"] label,[data-testid="stSlider"] span,[data-testid="stCheckbox"] label,[data-testid="stCheckbox"] span,[data-testid="stSelectbox"] label,[data-testid="stSelectbox"] span,[data-testid="stTextInput"] label,[data-testid="stDateInput"] label,[data-testid="stMetricLabel"]{color:#E5E7EB !important}
+[data-testid="stRadio"] label,[data-testid="stRadio"] span{color:#FFFFFF !important}
+[data-testid="stMetricValue"]{color:#FFFFFF !important;font-weight:800 !important}
+[data-testid="stSidebar"]{background:linear-gradient(180deg,#1e3a8a 0%,#1e40af 100%);color:#FFFFFF !important}
+.kpi-card{background:#FFFFFF !important;padding:28px;border-radius:16px;box-shadow:0 4px 20px rgba(0,0,0,0.3);border-left:6px solid #3b82f6;margin-bottom:1.5rem;color:#111827 !important}
+.kpi-value{font-size:40px;font-weight:900;color:#000000 !important;margin:14px 0}
+.kpi-label{font-size:13px;color:#374151 !important;text-transform:uppercase;letter-spacing:1.2px;font-weight:700}
+.kpi-trend{font-size:18px;font-weight:800;margin-top:14px}
+.trend-up{color:#10b981 !important}
+.trend-down{color:#ef4444 !important}
+.insight-card{background:#FFFFFF !important;padding:22px;border-radius:14px;box-shadow:0 3px 15px rgba(0,0,0,0.3);margin-bottom:18px;border-left:6px solid;color:#111827 !important}
+.insight-card strong{color:#111827 !important;font-size:16px;font-weight:800}
+.insight-card small{color:#374151 !important;font-size:14px}
+.insight-info{border-left-color:#3b82f6}
+.insight-success{border-left-color:#10b981}
+.insight-warning{border-left-color:#f59e0b}
+.white-box{background:#FFFFFF !important;padding:32px;border-radius:16px;box-shadow:0 4px 20px rgba(0,0,0,0.3);margin-bottom:2.5rem;color:#111827 !important}
+.section-title{font-size:24px;font-weight:900;color:#FFFFFF !important;margin:2.5rem 0 1.5rem 0;padding-left:16px;border-left:6px solid #3b82f6}
+.white-box .header-title{color:#111827 !important}
+.stButton>button{background:linear-gradient(135deg,#3b82f6 0%,#2563eb 100%);color:#FFFFFF !important;border:none;border-radius:14px;padding:16px 32px;font-weight:800;font-size:16px;box-shadow:0 6px 24px rgba(59,130,246,0.45)}
+.risk-low{background-color:#d1fae5;color:#065f46 !important;padding:8px 16px;border-radius:20px;font-weight:800}
+.risk-medium{background-color:#fef3c7;color:#92400e !important;padding:8px 16px;border-radius:20px;font-weight:800}
+.risk-high{background-color:#fee2e2;color:#991b1b !important;padding:8px 16px;border-radius:20px;font-weight:800}
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_css_block(), unsafe_allow_html=True)
+
+# The uploaded frame carries a digest of its source bytes in .attrs (set
+# by _parse_upload), so the aggregation caches key on content without
+# hashing the whole frame on every rerun. id() alone is not safe here:
+# a re-upload can reuse a garbage-collected frame's id and serve the
+# previous upload's aggregates. Frames without a digest fall back to
+# identity.
+_DF_HASH_FUNCS = {
+    pd.DataFrame: lambda d: (d.attrs.get('content_digest', id(d)), len(d))
+}
+
+# Module-level PCG64 generator: faster on small draws than the legacy
+# locked np.random global state, and seeded for reproducible demo data
+_RNG = np.random.default_rng(0)
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _daily_totals(df: pd.DataFrame) -> pd.Series:
+    """Total sales per date, computed once per uploaded frame"""
+    return df.groupby('date')['sales'].sum()
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def _product_last7_mean(df: pd.DataFrame) -> pd.Series:
+    """Mean of each product's last seven sales rows, one grouped pass
+
+    cumcount from the end ranks rows within each product without a
+    Python-level apply, so the tail-7 mean is two vectorized passes over
+    the frame regardless of how many products it holds.
+    """
+    rank_from_end = df.groupby('product', sort=False).cumcount(ascending=False)
+    tail_rows = df[rank_from_end < 7]
+    return tail_rows.groupby('product', sort=False)['sales'].mean()
+
+@st.cache_data(show_spinner=False)
+def _parse_upload(file_bytes: bytes, kind: str) -> pd.DataFrame:
+    """Parse an uploaded file once per unique content
+
+    Keyed on the raw bytes, so clicking Parse & Forecast again on the
+    same upload returns the cached frame instead of re-running the
+    parser.
+    """
+    buffer = io.BytesIO(file_bytes)
+    if kind == "CSV":
+        sales_data = CSVSalesParser().parse_csv(buffer)
+    else:
+        sales_data = PDFSalesParser().parse_pdf(buffer)
+    
+    # Canonicalize once at ingest: datetime dtype and a stable sort so
+    # no render path has to convert dates or re-sort per click
+    if 'date' in sales_data.columns:
+        sales_data['date'] = pd.to_datetime(sales_data['date'])
+        sort_cols = ['product', 'date'] if 'product' in sales_data.columns else ['date']
+        sales_data = sales_data.sort_values(sort_cols).reset_index(drop=True)
+    # Categorical codes make the repeated product groupbys and masks
+    # integer comparisons instead of string hashing
+    if 'product' in sales_data.columns:
+        sales_data['product'] = sales_data['product'].astype('category')
+    # Content fingerprint for the _DF_HASH_FUNCS cache keys; survives
+    # the pickling cache_data does on the way out
+    sales_data.attrs['content_digest'] = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+    return sales_data
 
 if 'forecast_data' not in st.session_state:
     st.session_state.forecast_data = None
@@ -277,7 +161,7 @@ def render_sidebar():
                     try:
                         if file_type == "CSV":
                             csv_parser = CSVSalesParser()
-                            sales_data = csv_parser.parse_csv(uploaded_file)
+                            sales_data = _parse_upload(uploaded_file.getvalue(), "CSV")
                             valid, msg = csv_parser.validate_data(sales_data)
                             
                             if valid:
@@ -294,7 +178,7 @@ def render_sidebar():
                         else:
                             # Parse PDF
                             parser = PDFSalesParser()
-                            sales_data = parser.parse_pdf(uploaded_file)
+                            sales_data = _parse_upload(uploaded_file.getvalue(), "PDF")
                             valid, msg = parser.validate_data(sales_data)
                             
                             if valid:
@@ -320,6 +204,25 @@ def render_sidebar():
         st.info("👤 Retail Manager")
         return page
 
+@st.cache_resource
+def _sparkline_svg(seed: int, color: str, base: float, scale: float) -> str:
+    """Inline SVG polyline sparkline, one cached string per KPI card
+
+    Seeded default_rng keeps the placeholder series stable. A 20-point
+    polyline is a few hundred bytes the browser paints directly, versus
+    a full plotly figure (tens of KB of JSON plus a scene graph) per
+    card.
+    """
+    rng = np.random.default_rng(seed)
+    y = base + rng.standard_normal(20).cumsum() * scale
+    span = y.max() - y.min()
+    norm = (y - y.min()) / span * 50 if span else np.full_like(y, 25.0)
+    points = " ".join(f"{i * 6},{55 - v:.1f}" for i, v in enumerate(norm))
+    return (
+        f'<svg width="120" height="60" viewBox="0 0 120 60">'
+        f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{points}"/></svg>'
+    )
+
 def render_kpi_cards():
     # Use PDF data if available
     if st.session_state.pdf_sales_data is not None and 'product' in st.session_state.pdf_sales_data.columns:
@@ -329,8 +232,9 @@ def render_kpi_cards():
         products = pdf_data['product'].unique()
         
         # Calculate growth
-        recent = pdf_data.groupby('date')['sales'].sum().tail(7).mean()
-        older = pdf_data.groupby('date')['sales'].sum().head(7).mean()
+        daily = _daily_totals(pdf_data)
+        recent = daily.tail(7).mean()
+        older = daily.head(7).mean()
         growth = ((recent - older) / older * 100) if older > 0 else 0
     else:
         total_sales = 2400000
@@ -338,55 +242,49 @@ def render_kpi_cards():
         growth = 12.5
         products = ['Product A', 'Product B', 'Product C']
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="kpi-card">
-            <div class="kpi-label">TOTAL SALES</div>
-            <div class="kpi-value">₹{total_sales/1000000:.1f}M</div>
-            <div class="kpi-trend trend-{'up' if growth > 0 else 'down'}">{'↑' if growth > 0 else '↓'} {abs(growth):.1f}%</div>
-        </div>
-        """, unsafe_allow_html=True)
-        fig = go.Figure(go.Scatter(y=np.random.randn(20).cumsum() + 100, mode='lines', line=dict(color='#3b82f6', width=2)))
-        fig.update_layout(height=60, margin=dict(l=0, r=0, t=0, b=0), showlegend=False, xaxis=dict(visible=False), yaxis=dict(visible=False))
-        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
-    
-    with col2:
-        st.markdown("""
-        <div class="kpi-card">
-            <div class="kpi-label">FORECAST ACCURACY</div>
-            <div class="kpi-value">87.3%</div>
-            <div class="kpi-trend trend-up">↑ 2.1%</div>
-        </div>
-        """, unsafe_allow_html=True)
-        fig = go.Figure(go.Scatter(y=85 + np.random.randn(20).cumsum() * 0.5, mode='lines', line=dict(color='#10b981', width=2)))
-        fig.update_layout(height=60, margin=dict(l=0, r=0, t=0, b=0), showlegend=False, xaxis=dict(visible=False), yaxis=dict(visible=False))
-        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
-    
-    with col3:
-        st.markdown(f"""
-        <div class="kpi-card">
-            <div class="kpi-label">PRODUCTS</div>
-            <div class="kpi-value">{len(products)}</div>
-            <div class="kpi-trend trend-up">Active</div>
-        </div>
-        """, unsafe_allow_html=True)
-        fig = go.Figure(go.Scatter(y=np.random.randn(20).cumsum() + 150, mode='lines', line=dict(color='#8b5cf6', width=2)))
-        fig.update_layout(height=60, margin=dict(l=0, r=0, t=0, b=0), showlegend=False, xaxis=dict(visible=False), yaxis=dict(visible=False))
-        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+    # One markdown call for all four cards: a single delta over the
+    # websocket and one DOM insertion instead of four
+    trend_class = 'up' if growth > 0 else 'down'
+    trend_arrow = '↑' if growth > 0 else '↓'
+    cards = [
+        f'<div class="kpi-card"><div class="kpi-label">TOTAL SALES</div><div class="kpi-value">₹{total_sales/1000000:.1f}M</div><div class="kpi-trend trend-{trend_class}">{trend_arrow} {abs(growth):.1f}%</div>{_sparkline_svg(1, "#3b82f6", 100, 1.0)}</div>',
+        f'<div class="kpi-card"><div class="kpi-label">FORECAST ACCURACY</div><div class="kpi-value">87.3%</div><div class="kpi-trend trend-up">↑ 2.1%</div>{_sparkline_svg(2, "#10b981", 85, 0.5)}</div>',
+        f'<div class="kpi-card"><div class="kpi-label">PRODUCTS</div><div class="kpi-value">{len(products)}</div><div class="kpi-trend trend-up">Active</div>{_sparkline_svg(3, "#8b5cf6", 150, 1.0)}</div>',
+        f'<div class="kpi-card"><div class="kpi-label">STOCKOUT RISK</div><div class="kpi-value">12.4%</div><div class="kpi-trend trend-down">↓ 3.2%</div>{_sparkline_svg(4, "#ef4444", 15, -0.3)}</div>',
+    ]
+    st.markdown(
+        "<div style='display:grid;grid-template-columns:repeat(4,1fr);gap:1rem'>" + "".join(cards) + "</div>",
+        unsafe_allow_html=True
+    )
+
+@st.cache_resource
+def _forecast_fig(fingerprint: tuple, _hist_dates, _hist_values, _forecast_dates, _forecast_values, _upper, _lower) -> go.Figure:
+    """Forecast figure keyed on a cheap data fingerprint
+
+    The underscore-prefixed arrays are excluded from the cache key, so a
+    hit costs one tuple comparison instead of hashing the series and
+    rebuilding the four traces and their layout dict.
+    """
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=_hist_dates, y=_hist_values, mode='lines', name='Actual', line=dict(color='#64748b', width=3)))
+    fig.add_trace(go.Scatter(x=_forecast_dates, y=_forecast_values, mode='lines', name='Forecast', line=dict(color='#3b82f6', width=4)))
+    fig.add_trace(go.Scatter(x=_forecast_dates, y=_upper, mode='lines', line=dict(width=0), showlegend=False))
+    fig.add_trace(go.Scatter(x=_forecast_dates, y=_lower, mode='lines', fill='tonexty', fillcolor='rgba(59, 130, 246, 0.2)', line=dict(width=0), name='90% Confidence'))
     
-    with col4:
-        st.markdown("""
-        <div class="kpi-card">
-            <div class="kpi-label">STOCKOUT RISK</div>
-            <div class="kpi-value">12.4%</div>
-            <div class="kpi-trend trend-down">↓ 3.2%</div>
-        </div>
-        """, unsafe_allow_html=True)
-        fig = go.Figure(go.Scatter(y=15 - np.random.randn(20).cumsum() * 0.3, mode='lines', line=dict(color='#ef4444', width=2)))
-        fig.update_layout(height=60, margin=dict(l=0, r=0, t=0, b=0), showlegend=False, xaxis=dict(visible=False), yaxis=dict(visible=False))
-        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+    fig.update_layout(
+        title=dict(text="<b>Sales Forecast with Confidence Intervals</b>", font=dict(size=22, color='#111827', family='Inter')),
+        xaxis_title=dict(text="<b>Date</b>", font=dict(color='#111827', size=15)),
+        yaxis_title=dict(text="<b>Sales (₹)</b>", font=dict(color='#111827', size=15)),
+        height=500,
+        plot_bgcolor='#fafafa',
+        paper_bgcolor='#FFFFFF',
+        font=dict(family="Inter", color='#111827', size=14),
+        legend=dict(font=dict(color='#111827', size=13)),
+        xaxis=dict(gridcolor='#e5e7eb', tickfont=dict(color='#111827', size=13)),
+        yaxis=dict(gridcolor='#e5e7eb', tickfont=dict(color='#111827', size=13)),
+        margin=dict(l=80, r=60, t=90, b=80)
+    )
+    return fig
 
 def render_forecast_chart():
     # Use PDF data if available, otherwise use sample data
@@ -394,43 +292,32 @@ def render_forecast_chart():
         pdf_data = st.session_state.pdf_sales_data
         
         # Aggregate by date for overall forecast
-        daily_sales = pdf_data.groupby('date')['sales'].sum().reset_index()
+        daily_sales = _daily_totals(pdf_data).reset_index()
         hist_dates = daily_sales['date']
-        hist_values = daily_sales['sales'].values
+        # One materialization that reuses the column's buffer; the
+        # ndarray then serves the std, cumsum and plotly traces alike
+        hist_values = daily_sales['sales'].to_numpy(dtype=np.float64, copy=False)
         
-        # Generate forecast from last value
-        forecast_dates = pd.date_range(start=hist_dates.iloc[-1] + timedelta(days=1), periods=30, freq='D')
-        forecast_values = hist_values[-1] + np.cumsum(np.random.randn(30) * (hist_values.std() * 0.1))
+        # Generate forecast from last value; std and the last date are
+        # hoisted so the array is only scanned once
+        last_date = hist_dates.iat[-1]
+        std = float(hist_values.std())
+        forecast_dates = pd.date_range(start=last_date + timedelta(days=1), periods=30, freq='D')
+        forecast_values = hist_values[-1] + (_RNG.standard_normal(30) * (std * 0.1)).cumsum()
         
-        upper = forecast_values + (hist_values.std() * 0.5)
-        lower = forecast_values - (hist_values.std() * 0.5)
+        upper = forecast_values + std * 0.5
+        lower = forecast_values - std * 0.5
+        fingerprint = (len(pdf_data), last_date, float(hist_values.sum()))
     else:
         hist_dates = pd.date_range(end=datetime.now(), periods=60, freq='D')
-        hist_values = 100 + np.cumsum(np.random.randn(60) * 2)
+        hist_values = 100 + _RNG.standard_normal(60).cumsum() * 2
         forecast_dates = pd.date_range(start=datetime.now() + timedelta(days=1), periods=30, freq='D')
-        forecast_values = hist_values[-1] + np.cumsum(np.random.randn(30) * 1.5)
+        forecast_values = hist_values[-1] + _RNG.standard_normal(30).cumsum() * 1.5
         upper = forecast_values + 10
         lower = forecast_values - 10
+        fingerprint = ('sample', len(hist_values))
     
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=hist_dates, y=hist_values, mode='lines', name='Actual', line=dict(color='#64748b', width=3)))
-    fig.add_trace(go.Scatter(x=forecast_dates, y=forecast_values, mode='lines', name='Forecast', line=dict(color='#3b82f6', width=4)))
-    fig.add_trace(go.Scatter(x=forecast_dates, y=upper, mode='lines', line=dict(width=0), showlegend=False))
-    fig.add_trace(go.Scatter(x=forecast_dates, y=lower, mode='lines', fill='tonexty', fillcolor='rgba(59, 130, 246, 0.2)', line=dict(width=0), name='90% Confidence'))
-    
-    fig.update_layout(
-        title=dict(text="<b>Sales Forecast with Confidence Intervals</b>", font=dict(size=22, color='#111827', family='Inter')),
-        xaxis_title=dict(text="<b>Date</b>", font=dict(color='#111827', size=15)),
-        yaxis_title=dict(text="<b>Sales (₹)</b>", font=dict(color='#111827', size=15)),
-        height=500,
-        plot_bgcolor='#fafafa',
-        paper_bgcolor='#FFFFFF',
-        font=dict(family="Inter", color='#111827', size=14),
-        legend=dict(font=dict(color='#111827', size=13)),
-        xaxis=dict(gridcolor='#e5e7eb', tickfont=dict(color='#111827', size=13)),
-        yaxis=dict(gridcolor='#e5e7eb', tickfont=dict(color='#111827', size=13)),
-        margin=dict(l=80, r=60, t=90, b=80)
-    )
+    fig = _forecast_fig(fingerprint, hist_dates, hist_values, forecast_dates, forecast_values, upper, lower)
     
     st.markdown('<div class="white-box">', unsafe_allow_html=True)
     if st.session_state.pdf_sales_data is not None and 'product' in st.session_state.pdf_sales_data.columns:
@@ -448,12 +335,19 @@ def render_product_table():
         pdf_data = st.session_state.pdf_sales_data
         products = pdf_data['product'].unique()
         
-        for i, prod in enumerate(products):
-            product_data = pdf_data[pdf_data['product'] == prod]
-            current = product_data['sales'].tail(7).mean()
-            forecast = current * (1 + np.random.uniform(-0.1, 0.2))
-            change = ((forecast - current) / current * 100)
-            risk = abs(change) + np.random.uniform(0, 10)
+        # Build every product's stats in one vectorized pass: the random
+        # perturbations are drawn as whole arrays and the arithmetic
+        # runs through DataFrame.eval, leaving the loop below to do
+        # rendering only
+        stats = _product_last7_mean(pdf_data).loc[products].rename('current').reset_index()
+        stats['noise'] = _RNG.uniform(-0.1, 0.2, size=len(stats))
+        stats['risk_noise'] = _RNG.uniform(0, 10, size=len(stats))
+        stats.eval("forecast = current * (1 + noise)", inplace=True)
+        stats.eval("change = (forecast - current) / current * 100", inplace=True)
+        stats.eval("risk = abs(change) + risk_noise", inplace=True)
+        
+        for i, row in enumerate(stats.itertuples()):
+            prod, current, forecast, change, risk = row.product, row.current, row.forecast, row.change, row.risk
             
             col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 1, 1])
             with col1:
@@ -492,6 +386,12 @@ def render_product_table():
     
     st.markdown('</div>', unsafe_allow_html=True)
 
+@st.cache_resource
+def _pdf_gen() -> PDFReportGenerator:
+    """One PDFReportGenerator shared across sessions; constructing it
+    per rerun redid its ReportLab style setup on every keystroke"""
+    return PDFReportGenerator()
+
 def render_insights():
     st.markdown('<p class="section-title">💡 Forecast Insights</p>', unsafe_allow_html=True)
     insights = [
@@ -503,6 +403,41 @@ def render_insights():
     for typ, title, desc in insights:
         st.markdown(f'<div class="insight-card insight-{typ}"><strong>{title}</strong><br><small>{desc}</small></div>', unsafe_allow_html=True)
 
+# Each page body is a fragment: widget events inside a page (report
+# buttons, settings toggles) rerun only that page's function instead of
+# triggering the three heavy render passes from a full script rerun
+@st.fragment
+def _dashboard_page():
+    st.markdown('<div class="white-box"><p class="header-title" style="color: #111827 !important;">Sales & Demand Forecast Dashboard</p></div>', unsafe_allow_html=True)
+    render_kpi_cards()
+    col_main, col_side = st.columns([7, 3])
+    with col_main:
+        st.markdown('<p class="section-title">📈 Sales Forecast</p>', unsafe_allow_html=True)
+        render_forecast_chart()
+        render_product_table()
+    with col_side:
+        render_insights()
+
+@st.fragment
+def _sales_forecast_page():
+    st.markdown('<p class="section-title">📊 Sales Forecast Analysis</p>', unsafe_allow_html=True)
+    render_forecast_chart()
+    render_product_table()
+
+@st.fragment
+def _inventory_page():
+    st.markdown('<p class="section-title">📦 Inventory Analysis</p>', unsafe_allow_html=True)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Inventory", "8,250", "+5.2%")
+    with col2:
+        st.metric("Avg Stock", "1,650", "-2.1%")
+    with col3:
+        st.metric("Reorder Point", "800")
+    with col4:
+        st.metric("Days of Stock", "45", "+3")
+    render_product_table()
+
 def main():
     page = render_sidebar()
     
@@ -514,39 +449,19 @@ def main():
                 st.markdown(f'<div class="white-box" style="text-align: center; height: 180px;"><div style="font-size: 52px;">{icon}</div><h3 style="color: #000000; margin: 12px 0;">{title}</h3></div>', unsafe_allow_html=True)
     
     elif page == "📈 Dashboard":
-        st.markdown('<div class="white-box"><p class="header-title" style="color: #111827 !important;">Sales & Demand Forecast Dashboard</p></div>', unsafe_allow_html=True)
-        render_kpi_cards()
-        col_main, col_side = st.columns([7, 3])
-        with col_main:
-            st.markdown('<p class="section-title">📈 Sales Forecast</p>', unsafe_allow_html=True)
-            render_forecast_chart()
-            render_product_table()
-        with col_side:
-            render_insights()
+        _dashboard_page()
     
     elif page == "📊 Sales Forecast":
-        st.markdown('<p class="section-title">📊 Sales Forecast Analysis</p>', unsafe_allow_html=True)
-        render_forecast_chart()
-        render_product_table()
+        _sales_forecast_page()
     
     elif page == "📦 Inventory":
-        st.markdown('<p class="section-title">📦 Inventory Analysis</p>', unsafe_allow_html=True)
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Inventory", "8,250", "+5.2%")
-        with col2:
-            st.metric("Avg Stock", "1,650", "-2.1%")
-        with col3:
-            st.metric("Reorder Point", "800")
-        with col4:
-            st.metric("Days of Stock", "45", "+3")
-        render_product_table()
+        _inventory_page()
     
     elif page == "📄 Reports":
         st.markdown('<p class="section-title">📄 Reports & Analytics</p>', unsafe_allow_html=True)
         col1, col2, col3 = st.columns(3)
         
-        pdf_gen = PDFReportGenerator()
+        pdf_gen = _pdf_gen()
         
         for col, (icon, title) in zip([col1, col2, col3], [("📊", "Forecast"), ("📈", "Performance"), ("📦", "Inventory")]):
             with col:
@@ -556,11 +471,11 @@ def main():
                         try:
                             # Generate sample data
                             hist_dates = pd.date_range(end=datetime.now(), periods=60, freq='D')
-                            hist_values = 100 + np.cumsum(np.random.randn(60) * 2)
+                            hist_values = 100 + _RNG.standard_normal(60).cumsum() * 2
                             data = pd.DataFrame({'date': hist_dates, 'sales': hist_values})
                             
                             forecast_dates = pd.date_range(start=datetime.now() + timedelta(days=1), periods=30, freq='D')
-                            forecast_values = hist_values[-1] + np.cumsum(np.random.randn(30) * 1.5)
+                            forecast_values = hist_values[-1] + _RNG.standard_normal(30).cumsum() * 1.5
                             forecast_data = pd.DataFrame({
                                 'date': forecast_dates,
                                 'forecast': forecast_values,
@@ -572,42 +487,38 @@ def main():
                                 # Use PDF data if available
                                 if st.session_state.pdf_sales_data is not None and 'product' in st.session_state.pdf_sales_data.columns:
                                     pdf_data = st.session_state.pdf_sales_data
-                                    daily_sales = pdf_data.groupby('date')['sales'].sum().reset_index()
+                                    daily_sales = _daily_totals(pdf_data).reset_index()
                                     data = daily_sales.rename(columns={'sales': 'sales'})
-                                    data['date'] = pd.to_datetime(data['date'])
                                     
-                                    hist_values = data['sales'].values
-                                    forecast_dates = pd.date_range(start=data['date'].iloc[-1] + timedelta(days=1), periods=30, freq='D')
-                                    forecast_values = hist_values[-1] + np.cumsum(np.random.randn(30) * (hist_values.std() * 0.1))
+                                    hist_values = data['sales'].to_numpy(dtype=np.float64, copy=False)
+                                    std = float(hist_values.std())
+                                    forecast_dates = pd.date_range(start=data['date'].iat[-1] + timedelta(days=1), periods=30, freq='D')
+                                    forecast_values = hist_values[-1] + (_RNG.standard_normal(30) * (std * 0.1)).cumsum()
                                     
-                                    products_forecast = []
-                                    for product in pdf_data['product'].unique():
-                                        product_data = pdf_data[pdf_data['product'] == product]
-                                        current = product_data['sales'].tail(7).mean()
-                                        forecast = current * (1 + np.random.uniform(-0.1, 0.2))
-                                        growth = ((forecast - current) / current * 100)
-                                        products_forecast.append({
-                                            'product': product,
-                                            'current_demand': current,
-                                            'forecast_demand': forecast,
-                                            'growth_pct': growth,
-                                            'confidence': np.random.uniform(0.75, 0.95)
-                                        })
-                                    products_forecast = pd.DataFrame(products_forecast)
+                                    products_forecast = _product_last7_mean(pdf_data).rename('current_demand').reset_index()
+                                    n_products = len(products_forecast)
+                                    products_forecast['forecast_demand'] = (
+                                        products_forecast['current_demand'] * (1 + _RNG.uniform(-0.1, 0.2, size=n_products))
+                                    )
+                                    products_forecast.eval(
+                                        "growth_pct = (forecast_demand - current_demand) / current_demand * 100",
+                                        inplace=True
+                                    )
+                                    products_forecast['confidence'] = _RNG.uniform(0.75, 0.95, size=n_products)
                                     
                                     forecast_data = pd.DataFrame({
                                         'date': forecast_dates,
                                         'forecast': forecast_values,
-                                        'lower_bound': forecast_values - (hist_values.std() * 0.5),
-                                        'upper_bound': forecast_values + (hist_values.std() * 0.5)
+                                        'lower_bound': forecast_values - std * 0.5,
+                                        'upper_bound': forecast_values + std * 0.5
                                     })
                                 else:
                                     hist_dates = pd.date_range(end=datetime.now(), periods=60, freq='D')
-                                    hist_values = 100 + np.cumsum(np.random.randn(60) * 2)
+                                    hist_values = 100 + _RNG.standard_normal(60).cumsum() * 2
                                     data = pd.DataFrame({'date': hist_dates, 'sales': hist_values})
                                     
                                     forecast_dates = pd.date_range(start=datetime.now() + timedelta(days=1), periods=30, freq='D')
-                                    forecast_values = hist_values[-1] + np.cumsum(np.random.randn(30) * 1.5)
+                                    forecast_values = hist_values[-1] + _RNG.standard_normal(30).cumsum() * 1.5
                                     
                                     products_forecast = pd.DataFrame({
                                         'product': ['Product A', 'Product B', 'Product C', 'Product D', 'Product E'],
@@ -640,48 +551,46 @@ def main():
                                 # Use PDF data if available
                                 if st.session_state.pdf_sales_data is not None and 'product' in st.session_state.pdf_sales_data.columns:
                                     pdf_data = st.session_state.pdf_sales_data
-                                    inventory_list = []
-                                    restock_list = []
+                                    inventory_data = _product_last7_mean(pdf_data).rename('last7_mean').reset_index()
+                                    inventory_data.eval("current_stock = last7_mean * 3", inplace=True)
+                                    inventory_data.eval("forecast_demand = last7_mean * 30", inplace=True)
+                                    inventory_data['coverage_days'] = np.where(
+                                        inventory_data['forecast_demand'] > 0,
+                                        inventory_data['current_stock'] / (inventory_data['forecast_demand'] / 30),
+                                        30
+                                    )
+                                    inventory_data = inventory_data.drop(columns='last7_mean')
                                     
-                                    for product in pdf_data['product'].unique():
-                                        product_data = pdf_data[pdf_data['product'] == product]
-                                        current_stock = product_data['sales'].tail(7).mean() * 3
-                                        forecast_demand = product_data['sales'].tail(7).mean() * 30
-                                        coverage = (current_stock / (forecast_demand / 30)) if forecast_demand > 0 else 30
-                                        
-                                        inventory_list.append({
-                                            'product': product,
-                                            'current_stock': current_stock,
-                                            'forecast_demand': forecast_demand,
-                                            'coverage_days': coverage
+                                    restock = inventory_data[inventory_data['coverage_days'] < 15]
+                                    if len(restock):
+                                        restock_schedule = pd.DataFrame({
+                                            'product': restock['product'].to_numpy(),
+                                            'restock_date': [
+                                                (datetime.now() + timedelta(days=int(coverage))).strftime('%Y-%m-%d')
+                                                for coverage in restock['coverage_days']
+                                            ],
+                                            'quantity': restock['forecast_demand'].to_numpy() * 0.5,
+                                            'priority': np.where(restock['coverage_days'] < 10, 'Critical', 'High')
+                                        })
+                                    else:
+                                        restock_schedule = pd.DataFrame({
+                                            'product': ['No restocking needed'],
+                                            'restock_date': ['-'],
+                                            'quantity': [0],
+                                            'priority': ['Low']
                                         })
-                                        
-                                        if coverage < 15:
-                                            restock_list.append({
-                                                'product': product,
-                                                'restock_date': (datetime.now() + timedelta(days=int(coverage))).strftime('%Y-%m-%d'),
-                                                'quantity': forecast_demand * 0.5,
-                                                'priority': 'Critical' if coverage < 10 else 'High'
-                                            })
-                                    
-                                    inventory_data = pd.DataFrame(inventory_list)
-                                    restock_schedule = pd.DataFrame(restock_list) if restock_list else pd.DataFrame({
-                                        'product': ['No restocking needed'],
-                                        'restock_date': ['-'],
-                                        'quantity': [0],
-                                        'priority': ['Low']
-                                    })
                                     
                                     # Generate forecast data for inventory report
-                                    daily_sales = pdf_data.groupby('date')['sales'].sum().reset_index()
-                                    hist_values = daily_sales['sales'].values
-                                    forecast_dates = pd.date_range(start=daily_sales['date'].iloc[-1] + timedelta(days=1), periods=30, freq='D')
-                                    forecast_values = hist_values[-1] + np.cumsum(np.random.randn(30) * (hist_values.std() * 0.1))
+                                    daily_sales = _daily_totals(pdf_data).reset_index()
+                                    hist_values = daily_sales['sales'].to_numpy(dtype=np.float64, copy=False)
+                                    std = float(hist_values.std())
+                                    forecast_dates = pd.date_range(start=daily_sales['date'].iat[-1] + timedelta(days=1), periods=30, freq='D')
+                                    forecast_values = hist_values[-1] + (_RNG.standard_normal(30) * (std * 0.1)).cumsum()
                                     forecast_data = pd.DataFrame({
                                         'date': forecast_dates,
                                         'forecast': forecast_values,
-                                        'lower_bound': forecast_values - (hist_values.std() * 0.5),
-                                        'upper_bound': forecast_values + (hist_values.std() * 0.5)
+                                        'lower_bound': forecast_values - std * 0.5,
+                                        'upper_bound': forecast_values + std * 0.5
                                     })
                                 else:
                                     inventory_data = pd.DataFrame({
@@ -699,9 +608,9 @@ def main():
                                     
                                     # Generate sample forecast data
                                     hist_dates = pd.date_range(end=datetime.now(), periods=60, freq='D')
-                                    hist_values = 100 + np.cumsum(np.random.randn(60) * 2)
+                                    hist_values = 100 + _RNG.standard_normal(60).cumsum() * 2
                                     forecast_dates = pd.date_range(start=datetime.now() + timedelta(days=1), periods=30, freq='D')
-                                    forecast_values = hist_values[-1] + np.cumsum(np.random.randn(30) * 1.5)
+                                    forecast_values = hist_values[-1] + _RNG.standard_normal(30).cumsum() * 1.5
                                     forecast_data = pd.DataFrame({
                                         'date': forecast_dates,
                                         'forecast': forecast_values,
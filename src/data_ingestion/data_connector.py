@@ -1,5 +1,6 @@
 # src/data_ingestion/data_connector.py
 
+import os
 import pandas as pd
 import numpy as np
 from typing import Optional
@@ -11,40 +12,64 @@ class DataConnector:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.enricher = ExternalDataEnricher(config)
-        
-    def load_training_data(self, target_column: str, date_column: str, 
-                          file_path: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
-        """Load and validate CSV data"""
-        if file_path is None:
-            file_path = self.config.get('data_path', 'data/sample_data.csv')
-            
+        # Cleaned base frame cached per (path, columns, mtime) so repeated
+        # loads (backfill refits, predict-after-fit) skip the CSV parse
+        self._base_data_cache = {}
+
+    def _load_base_data(self, file_path: str, target_column: str, date_column: str) -> pd.DataFrame:
+        """Read, validate and clean the CSV, cached on path and file mtime"""
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            mtime = None
+
+        cache_key = (file_path, target_column, date_column, mtime)
+        cached = self._base_data_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         self.logger.info(f"Loading data from {file_path}")
-        
+
         # Load CSV
         data = pd.read_csv(file_path)
-        
+
         # Validate required columns
         if target_column not in data.columns:
             raise ValueError(f"Target column '{target_column}' not found")
         if date_column not in data.columns:
             raise ValueError(f"Date column '{date_column}' not found")
-            
+
         # Convert date column
         data[date_column] = pd.to_datetime(data[date_column])
-        
+
         # Handle missing values in target
         data[target_column] = data[target_column].fillna(method='ffill').fillna(method='bfill')
-        
+
+        # Sort by date
+        data = data.sort_values(date_column).reset_index(drop=True)
+
+        if mtime is not None:
+            # Keep only the latest frame so stale versions don't pile up
+            self._base_data_cache = {cache_key: data}
+
+        return data
+
+    def load_training_data(self, target_column: str, date_column: str,
+                          file_path: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        """Load and validate CSV data"""
+        if file_path is None:
+            file_path = self.config.get('data_path', 'data/sample_data.csv')
+
+        # Work on a copy so the cached frame is never mutated downstream
+        data = self._load_base_data(file_path, target_column, date_column).copy()
+
         # Filter by end date if provided
         if end_date:
             data = data[data[date_column] <= end_date]
-            
-        # Sort by date
-        data = data.sort_values(date_column).reset_index(drop=True)
-        
+
         # Enrich with external API data
         data = self.enricher.enrich_data(data, date_column)
-        
+
         self.logger.info(f"Loaded {len(data)} records with {len(data.columns)} features")
         return data
     
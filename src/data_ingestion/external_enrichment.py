@@ -1,5 +1,12 @@
 # src/data_ingestion/external_enrichment.py
 
+import hashlib
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
@@ -16,8 +23,13 @@ class ExternalDataEnricher:
     def __init__(self, config: dict):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.api_enabled = config.get('external_apis', {}).get('enabled', False)
-        self.api_configs = config.get('external_apis', {}).get('sources', {})
+        api_config = config.get('external_apis', {})
+        self.api_enabled = api_config.get('enabled', False)
+        self.api_configs = api_config.get('sources', {})
+        # Optional on-disk cache so repeat runs (demos, comparisons) skip
+        # the API round-trips entirely; disabled when cache_dir is unset
+        self.cache_dir = api_config.get('cache_dir')
+        self.cache_ttl_seconds = api_config.get('cache_ttl_seconds', 3600)
         
     def enrich_data(self, data: pd.DataFrame, date_column: str) -> pd.DataFrame:
         """
@@ -40,22 +52,37 @@ class ExternalDataEnricher:
         start_date = pd.to_datetime(enriched_data[date_column]).min()
         end_date = pd.to_datetime(enriched_data[date_column]).max()
         
-        # Fetch and merge each external source
-        if self.api_configs.get('weather', {}).get('enabled', False):
-            weather_data = self._fetch_weather_data(start_date, end_date)
-            enriched_data = self._merge_external_data(enriched_data, weather_data, date_column)
-            
-        if self.api_configs.get('news', {}).get('enabled', False):
-            news_data = self._fetch_news_data(start_date, end_date)
-            enriched_data = self._merge_external_data(enriched_data, news_data, date_column)
-            
-        if self.api_configs.get('analytics', {}).get('enabled', False):
-            analytics_data = self._fetch_analytics_data(start_date, end_date)
-            enriched_data = self._merge_external_data(enriched_data, analytics_data, date_column)
-            
-        if self.api_configs.get('ecommerce', {}).get('enabled', False):
-            ecommerce_data = self._fetch_ecommerce_data(start_date, end_date)
-            enriched_data = self._merge_external_data(enriched_data, ecommerce_data, date_column)
+        # Fetch all enabled sources concurrently (cached on disk when
+        # configured): the fetches are independent HTTP waterfalls, so
+        # overall latency drops from the sum to the slowest source
+        fetchers = {
+            'weather': self._fetch_weather_data,
+            'news': self._fetch_news_data,
+            'analytics': self._fetch_analytics_data,
+            'ecommerce': self._fetch_ecommerce_data
+        }
+        enabled_sources = [
+            source for source in fetchers
+            if self.api_configs.get(source, {}).get('enabled', False)
+        ]
+
+        if enabled_sources:
+            with ThreadPoolExecutor(max_workers=len(enabled_sources)) as executor:
+                futures = {
+                    source: executor.submit(
+                        self._fetch_with_cache, source, fetchers[source], start_date, end_date
+                    )
+                    for source in enabled_sources
+                }
+
+                # Merge in a fixed order so column layout stays deterministic
+                for source in enabled_sources:
+                    try:
+                        external_data = futures[source].result()
+                    except Exception as e:
+                        self.logger.error(f"{source} fetch failed: {str(e)}")
+                        external_data = pd.DataFrame()
+                    enriched_data = self._merge_external_data(enriched_data, external_data, date_column)
             
         # Handle missing values in external features
         enriched_data = self._handle_missing_values(enriched_data, data.columns.tolist())
@@ -63,6 +90,44 @@ class ExternalDataEnricher:
         self.logger.info(f"Data enriched with {len(enriched_data.columns) - len(data.columns)} external features")
         return enriched_data
     
+    def _fetch_with_cache(self, source: str, fetch_fn, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        Fetch external data through an on-disk cache when a cache_dir is configured
+
+        Cache entries are keyed by source name, date range and source config,
+        and expire after cache_ttl_seconds. Cache failures fall back to a
+        direct fetch so enrichment never breaks because of the cache.
+        """
+        if not self.cache_dir:
+            return fetch_fn(start_date, end_date)
+
+        source_config = self.api_configs.get(source, {})
+        cache_key = hashlib.sha1(
+            f"{source}|{start_date}|{end_date}|{sorted(source_config.items())}".encode()
+        ).hexdigest()
+        cache_path = Path(self.cache_dir) / f"{source}_{cache_key}.pkl"
+
+        # Try cache first
+        try:
+            if cache_path.exists() and (time.time() - os.path.getmtime(cache_path)) < self.cache_ttl_seconds:
+                with open(cache_path, 'rb') as f:
+                    cached_data = pickle.load(f)
+                self.logger.info(f"Loaded {source} data from cache")
+                return cached_data
+        except Exception as e:
+            self.logger.warning(f"Cache read failed for {source}: {str(e)}")
+
+        # Cache miss: fetch and store
+        data = fetch_fn(start_date, end_date)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.logger.warning(f"Cache write failed for {source}: {str(e)}")
+
+        return data
+
     def _fetch_weather_data(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """Fetch weather data from API or generate mock data"""
         try:
@@ -119,7 +119,29 @@ class ForecastEngine:
         
         return self
     
-    def predict(self, 
+    def refit(self, train_end_date: Optional[str] = None) -> 'ForecastEngine':
+        """
+        Retrain on data up to a new cutoff, reusing constructed components
+
+        Unlike building a fresh engine per cutoff, this keeps the data
+        connector, feature builder and other components alive across
+        calls so only the model fitting itself is redone. Intended for
+        backfill-style loops that sweep many training cutoffs.
+
+        Args:
+            train_end_date: End date for training data
+
+        Returns:
+            Self for method chaining
+        """
+        return self.fit(
+            target_column=self.config['target_column'],
+            date_column=self.config['date_column'],
+            external_features=getattr(self, 'external_features', None),
+            train_end_date=train_end_date
+        )
+
+    def predict(self,
                 horizon: int,
                 confidence_levels: List[float] = [0.1, 0.5, 0.9],
                 include_explanation: bool = True) -> Dict[str, Any]:
@@ -186,7 +208,62 @@ class ForecastEngine:
         self.logger.info("Forecast generation completed")
         return results
     
-    def run_scenario(self, 
+    def predict_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Serve many forecast requests from a single inference pass
+
+        The data load, feature build and ensemble prediction are shared:
+        one predict() runs at the longest requested horizon with the
+        union of all confidence levels, and each request's result is
+        carved out of that pass. Per-request cost is reduced to slicing.
+
+        Args:
+            requests: List of dicts with 'horizon' and optionally
+                'confidence_levels' and 'include_explanation'
+
+        Returns:
+            One result dict per request, in input order
+        """
+        if not requests:
+            return []
+
+        default_levels = (0.1, 0.5, 0.9)
+        max_horizon = max(r['horizon'] for r in requests)
+        all_levels = sorted({level for r in requests
+                             for level in r.get('confidence_levels', default_levels)})
+        any_explanation = any(r.get('include_explanation', True) for r in requests)
+
+        base = self.predict(
+            horizon=max_horizon,
+            confidence_levels=all_levels,
+            include_explanation=any_explanation
+        )
+
+        results = []
+        for r in requests:
+            horizon = r['horizon']
+            levels = list(r.get('confidence_levels', default_levels))
+
+            intervals = {}
+            for level in levels:
+                for side in ('lower', 'upper'):
+                    key = f'{side}_{level}'
+                    if key in base['prediction_intervals']:
+                        intervals[key] = base['prediction_intervals'][key][:horizon]
+
+            results.append({
+                'forecast': base['forecast'][:horizon],
+                'prediction_intervals': intervals,
+                'confidence_levels': levels,
+                'horizon': horizon,
+                'timestamp': base['timestamp'],
+                'model_performance': base['model_performance'],
+                'explanations': base['explanations'] if r.get('include_explanation', True) else None
+            })
+
+        return results
+
+    def run_scenario(self,
                     scenario_config: Dict[str, Any],
                     horizon: int) -> Dict[str, Any]:
         """
@@ -91,7 +91,23 @@ class ModelManager:
             self.logger.error(f"Failed to load model: {e}")
             raise
     
-    def check_performance_drift(self, current_metrics: Dict[str, float], 
+    def load_metadata_only(self, version: Optional[str] = None) -> Dict:
+        """Load only a version's metadata, skipping the model pickles
+
+        Cheap enough for scheduled trigger checks: one small JSON read
+        instead of unpickling every model and the ensemble.
+        """
+        if version is None:
+            version = self.get_latest_version()
+
+        if version is None:
+            raise ValueError("No models found")
+
+        metadata_file = self.model_registry_path / version / "metadata.json"
+        with open(metadata_file, 'r') as f:
+            return json.load(f)
+
+    def check_performance_drift(self, current_metrics: Dict[str, float],
                                threshold: float = 0.1) -> bool:
         """Check for performance drift"""
         if not self.performance_history:
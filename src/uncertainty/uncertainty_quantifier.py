@@ -37,8 +37,8 @@ class UncertaintyQuantifier:
             self.logger.warning(f"Uncertainty fitting failed: {e}")
             self.residuals_std = 1.0  # Default fallback
     
-    def calculate_intervals(self, forecast: pd.Series, confidence_levels: List[float], 
-                          horizon: int) -> Dict[str, List[float]]:
+    def calculate_intervals(self, forecast: pd.Series, confidence_levels: List[float],
+                          horizon: int) -> Dict[str, np.ndarray]:
         """Calculate prediction intervals"""
         self.logger.info(f"Calculating intervals for {len(confidence_levels)} confidence levels")
         
@@ -53,20 +53,21 @@ class UncertaintyQuantifier:
         else:
             forecast_values = np.array(forecast)
         
-        for confidence_level in confidence_levels:
-            # Calculate z-score for confidence level
-            alpha = 1 - confidence_level
-            z_score = self._get_z_score(alpha / 2)
-            
-            # Calculate interval width
-            interval_width = z_score * self.residuals_std
-            
-            # Calculate bounds
-            lower_bound = forecast_values - interval_width
-            upper_bound = forecast_values + interval_width
-            
-            intervals[f'lower_{confidence_level}'] = lower_bound.tolist()
-            intervals[f'upper_{confidence_level}'] = upper_bound.tolist()
+        # Two broadcasts build all bounds as (levels, horizon) matrices;
+        # the per-level dict entries are just row views with the level
+        # labels attached, so no per-level allocation loop remains
+        z_scores = np.array([self._get_z_score((1 - level) / 2)
+                             for level in confidence_levels])
+        interval_widths = z_scores[:, None] * self.residuals_std
+        lower_bounds = forecast_values[None, :] - interval_widths
+        upper_bounds = forecast_values[None, :] + interval_widths
+
+        # Keep the bounds as float64 arrays: consumers plot or slice
+        # them directly, and orjson serializes ndarrays natively, so
+        # expanding to Python floats here would only cost memory
+        for i, confidence_level in enumerate(confidence_levels):
+            intervals[f'lower_{confidence_level}'] = lower_bounds[i]
+            intervals[f'upper_{confidence_level}'] = upper_bounds[i]
         
         return intervals
     
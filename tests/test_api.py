@@ -6,18 +6,32 @@ Unit tests for API endpoints
 
 import pytest
 import json
+import threading
 from fastapi.testclient import TestClient
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add the repo root to the path so src.api.main imports as part of the
+# src package and its relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Mock the ForecastEngine to avoid actual training during tests
+class MockDataConnector:
+    def get_data_quality_metrics(self):
+        return {
+            'overall_score': 0.9,
+            'completeness': 0.95,
+            'consistency': 0.88,
+            'timeliness': 0.92,
+            'issues': [],
+            'recommendations': []
+        }
+
 class MockForecastEngine:
     def __init__(self, config):
         self.config = config
         self.is_trained = True
+        self.data_connector = MockDataConnector()
         
     def fit(self, *args, **kwargs):
         return self
@@ -75,19 +89,28 @@ class MockModelManager:
 @pytest.fixture
 def mock_app():
     """Create test app with mocked dependencies"""
-    # Import after mocking
-    import api.main as api_main
+    import src.api.main as api_main
+    
+    engine = MockForecastEngine({})
+    manager = MockModelManager()
+    lock = threading.Lock()
     
-    # Replace the global instances with mocks
-    api_main.forecast_engine = MockForecastEngine({})
-    api_main.model_manager = MockModelManager()
+    # Override the app.state dependencies so handlers get the mocks and
+    # the lifespan (which builds the real components) never has to run
+    api_main.app.dependency_overrides[api_main.get_engine] = lambda: engine
+    api_main.app.dependency_overrides[api_main.get_model_manager] = lambda: manager
+    api_main.app.dependency_overrides[api_main.get_train_lock] = lambda: lock
     
-    return api_main.app
+    yield api_main.app
+    
+    api_main.app.dependency_overrides.clear()
 
 @pytest.fixture
 def client(mock_app):
-    """Create test client"""
-    return TestClient(mock_app)
+    """Create test client with the expected bearer token preset"""
+    test_client = TestClient(mock_app)
+    test_client.headers["Authorization"] = "Bearer your-api-token"
+    return test_client
 
 class TestHealthEndpoint:
     """Test health check endpoint"""
@@ -320,14 +343,25 @@ class TestErrorHandling:
         assert response.status_code == 404
 
 class TestAuthentication:
-    """Test authentication (if implemented)"""
-    
-    def test_unauthenticated_request(self, client):
-        """Test request without authentication"""
-        # Note: This test assumes authentication is implemented
-        # If not implemented, this test might need to be skipped
-        
-        # For now, just test that endpoints are accessible
-        # In production, you would test with missing/invalid tokens
-        response = client.get("/health")
+    """Test bearer token authentication"""
+
+    def test_missing_credentials(self, mock_app):
+        """Test request without an Authorization header"""
+        response = TestClient(mock_app).get("/model/status")
+
+        # HTTPBearer rejects missing credentials with 403
+        assert response.status_code == 403
+
+    def test_invalid_token(self, mock_app):
+        """Test request with a wrong bearer token"""
+        response = TestClient(mock_app).get(
+            "/model/status",
+            headers={"Authorization": "Bearer wrong-token"}
+        )
+
+        assert response.status_code == 401
+
+    def test_health_endpoint_open(self, mock_app):
+        """Test health check works without credentials"""
+        response = TestClient(mock_app).get("/health")
         assert response.status_code == 200
\ No newline at end of file